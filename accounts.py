@@ -0,0 +1,36 @@
+import os
+import uuid
+
+
+# =========================
+# KONFIGURASI
+# =========================
+DEFAULT_BASE_URL = "http://localhost/quiz-pengupil-main/quiz-pengupil-main"
+TIMEOUT = int(os.getenv("SELENIUM_TIMEOUT", "10"))
+
+# Diisi pytest-xdist di setiap proses worker ("gw0", "gw1", ...); kosong bila serial
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "")
+
+
+def base_url() -> str:
+    """Dibaca saat dipakai, karena STUB_SERVER=1 baru mengisi BASE_URL ketika pytest mulai."""
+    return os.getenv("BASE_URL", DEFAULT_BASE_URL)
+
+
+# =========================
+# AKUN PER WORKER
+# =========================
+def worker_username(base: str) -> str:
+    """user01 -> user01 saat serial, user01_gw3 di worker gw3."""
+    return f"{base}_{WORKER_ID}" if WORKER_ID else base
+
+
+def unique_suffix(length: int = 8) -> str:
+    """Suffix acak untuk data registrasi, diberi tag worker agar tidak bentrok antar worker."""
+    return f"{WORKER_ID}{uuid.uuid4().hex[:length]}"
+
+
+# Akun existing - user01 dibuat di CI workflow dengan password pass123.
+# Saat paralel setiap worker memakai akun sendiri (user01_gwN) yang dibuat otomatis.
+VALID_USERNAME = worker_username("user01")
+VALID_PASSWORD = "pass123"
@@ -0,0 +1,451 @@
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+
+from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from browser_memory import MemoryGuard
+from timing import phase, record_navigation, record_server_timing
+
+
+# =========================
+# KONFIGURASI
+# =========================
+HEADLESS = os.getenv("HEADLESS", "0") == "1"
+TIMEOUT = int(os.getenv("SELENIUM_TIMEOUT", "10"))
+POLL_INTERVAL = 0.05
+
+# FILL_MODE=script (default): semua field diisi dalam satu execute_script
+# FILL_MODE=keys            : clear + send_keys per field (meniru ketikan user)
+FILL_MODE = os.getenv("FILL_MODE", "script")
+
+# eager: driver.get selesai saat HTML aplikasi sudah di-parse, tanpa menunggu
+# CSS/JS pihak ketiga; set "normal" untuk perilaku lama (tunggu event load)
+PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager")
+
+# Pola URL yang diblokir lewat DevTools (pisahkan dengan koma, kosongkan untuk
+# menonaktifkan). Default: CDN Bootstrap/jQuery/Popper yang dipakai halaman.
+BLOCKED_URLS = [
+    p.strip() for p in os.getenv(
+        "BLOCKED_URLS",
+        "*stackpath.bootstrapcdn.com*,*code.jquery.com*,*cdnjs.cloudflare.com*",
+    ).split(",") if p.strip()
+]
+
+# Jika diisi, hanya host ini yang bisa di-resolve browser (allowlist), mis.
+# ALLOWED_HOSTS=127.0.0.1,localhost -- request ke host lain langsung gagal
+ALLOWED_HOSTS = [h.strip() for h in os.getenv("ALLOWED_HOSTS", "").split(",") if h.strip()]
+
+# Browser di-restart setelah dipakai N test (0 = tidak pernah di-restart)
+DRIVER_RECYCLE_AFTER = int(os.getenv("DRIVER_RECYCLE_AFTER", "50"))
+
+# Template user-data-dir yang sudah melewati inisialisasi first-run Chrome.
+# Setiap browser memakai salinannya sendiri (kosong = profil baru setiap start).
+# Buat dengan: python -m tools.bench_browser_start --make-template <dir>
+PROFILE_TEMPLATE = os.getenv("CHROME_PROFILE_TEMPLATE", "")
+
+# Path binary chrome-headless-shell; dipakai menggantikan Chrome penuh saat HEADLESS=1
+HEADLESS_SHELL = os.getenv("CHROME_HEADLESS_SHELL", "")
+
+# Isolasi antar test di browser yang dipakai ulang:
+# reset   -> cookie & storage dibersihkan setelah test (default)
+# context -> setiap test mendapat browser context DevTools baru (cookie jar dan
+#            sesi PHP sendiri) di dalam proses Chrome yang sama; dibuang setelah test
+BROWSER_ISOLATION = os.getenv("BROWSER_ISOLATION", "reset")
+
+
+# =========================
+# DRIVER (INCOGNITO)
+# =========================
+# Salinan profil milik setiap browser, dihapus oleh quit_driver()
+_profile_dirs = {}
+
+
+def chrome_options(headless: bool = False, headless_shell: str = HEADLESS_SHELL) -> ChromeOptions:
+    options = ChromeOptions()
+    options.add_argument("--incognito")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+
+    if headless and headless_shell:
+        # chrome-headless-shell selalu headless dan tidak memuat UI browser penuh
+        options.binary_location = headless_shell
+    elif headless:
+        options.add_argument("--headless=new")
+
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+    if ALLOWED_HOSTS:
+        rules = ", ".join(["MAP * ~NOTFOUND"] + [f"EXCLUDE {host}" for host in ALLOWED_HOSTS])
+        options.add_argument(f"--host-resolver-rules={rules}")
+    return options
+
+
+def create_chrome_driver(headless: bool = False, profile_template: str = PROFILE_TEMPLATE,
+                         headless_shell: str = HEADLESS_SHELL):
+    options = chrome_options(headless, headless_shell)
+    profile_dir = clone_profile(profile_template) if profile_template else None
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+
+    try:
+        driver = webdriver.Chrome(options=options)
+    except Exception:
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
+    if profile_dir:
+        _profile_dirs[driver] = profile_dir
+    driver.set_window_size(1280, 720)
+    block_urls(driver)
+    return driver
+
+
+def quit_driver(driver):
+    """driver.quit() lalu hapus salinan profil milik browser tersebut (bila ada)."""
+    try:
+        driver.quit()
+    finally:
+        profile_dir = _profile_dirs.pop(driver, None)
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+# =========================
+# TEMPLATE PROFIL
+# =========================
+def clone_profile(template: str) -> str:
+    """Salin template user-data-dir ke direktori sementara baru (satu per browser)."""
+    target = tempfile.mkdtemp(prefix="chrome-profile-")
+    # Singleton* = lock milik proses Chrome yang membuat template
+    shutil.copytree(template, target, symlinks=True, dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("Singleton*"))
+    return target
+
+
+def make_profile_template(path: str, headless: bool = True, headless_shell: str = HEADLESS_SHELL):
+    """
+    Jalankan Chrome sekali dengan user-data-dir `path` sampai inisialisasi
+    first-run selesai, lalu tutup dengan rapi sehingga direktori siap disalin.
+    Buat template dengan binary yang sama dengan yang dipakai test.
+    """
+    options = chrome_options(headless, headless_shell)
+    options.add_argument(f"--user-data-dir={os.path.abspath(path)}")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get("about:blank")
+    finally:
+        driver.quit()
+
+
+def block_urls(driver, patterns=None):
+    """Blokir request yang cocok dengan pola (wildcard *) di tab aktif lewat CDP."""
+    patterns = BLOCKED_URLS if patterns is None else patterns
+    if patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def reset_driver(driver):
+    """
+    Kembalikan browser ke kondisi bersih: storage halaman aktif dikosongkan,
+    semua cookie (termasuk PHPSESSID) dihapus, lalu pindah ke about:blank.
+    """
+    if driver.current_url.startswith("http"):
+        driver.execute_script("localStorage.clear(); sessionStorage.clear();")
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.get("about:blank")
+
+
+def open_context(driver) -> str:
+    """
+    Buat browser context baru berisi satu tab about:blank lalu pindahkan
+    driver ke tab tersebut. Mengembalikan id context untuk close_context().
+    """
+    context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+    target = driver.execute_cdp_cmd("Target.createTarget", {
+        "url": "about:blank", "browserContextId": context_id, "width": 1280, "height": 720,
+    })
+    # Window handle ChromeDriver = targetId DevTools
+    driver.switch_to.window(target["targetId"])
+    block_urls(driver)
+    return context_id
+
+
+def close_context(driver, context_id: str, home_handle: str):
+    """Kembali ke tab awal browser lalu buang context beserta tab, cookie, dan storage-nya."""
+    driver.switch_to.window(home_handle)
+    driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+
+
+# =========================
+# NAVIGASI & SINKRONISASI SUBMIT
+# =========================
+# Dengan strategi eager, dokumen dianggap siap begitu HTML selesai di-parse
+READY_STATES = ("interactive", "complete") if PAGE_LOAD_STRATEGY == "eager" else ("complete",)
+
+
+# readyState; setelah siap sekalian Navigation Timing dokumen, Server-Timing
+# respons dokumen, dan jumlah/ukuran resource yang memblokir render (tanpa
+# round trip tambahan)
+_READY_JS = """
+const state = document.readyState;
+const nav = performance.getEntriesByType('navigation')[0];
+if (!arguments[0].includes(state) || !nav) return {state: state};
+const blocking = performance.getEntriesByType('resource').filter(r => r.renderBlockingStatus
+    ? r.renderBlockingStatus === 'blocking'
+    : ['link', 'script'].includes(r.initiatorType));
+return {
+    state: state,
+    page: location.pathname.split('/').pop(),
+    ttfb: nav.responseStart,
+    dcl: nav.domContentLoadedEventEnd,
+    load: nav.loadEventEnd,
+    blocking_count: blocking.length,
+    blocking_bytes: blocking.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    server: Object.fromEntries((nav.serverTiming || []).map(e => [e.name, e.duration])),
+};
+"""
+
+
+def _ready_state(driver):
+    result = driver.execute_script(_READY_JS, list(READY_STATES))
+    return result if result["state"] in READY_STATES else False
+
+
+def wait_ready(driver, timeout: int = TIMEOUT):
+    with phase("wait_ready"):
+        result = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(_ready_state)
+    if result.get("page"):
+        entry = {"page": result["page"], "blocking_count": result["blocking_count"],
+                 "blocking_bytes": result["blocking_bytes"]}
+        # Event yang belum terjadi (mis. load saat strategi eager) bernilai 0 -> tidak dicatat
+        for key in ("ttfb", "dcl", "load"):
+            if result[key]:
+                entry[key] = round(result[key], 2)
+        record_navigation(entry)
+        record_server_timing(result["page"], result["server"])
+
+
+def open_page(driver, url: str, timeout: int = TIMEOUT):
+    """driver.get + wait_ready, masing-masing dicatat sebagai fase sendiri."""
+    with phase("get"):
+        driver.get(url)
+    wait_ready(driver, timeout)
+
+
+# readyState dokumen baru hasil submit + Server-Timing respons dokumen tersebut
+_SUBMITTED_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+return {
+    state: document.readyState,
+    page: location.pathname.split('/').pop(),
+    server: Object.fromEntries(((nav && nav.serverTiming) || []).map(e => [e.name, e.duration])),
+};
+"""
+
+
+def submit_and_wait(driver, button, timeout: int = TIMEOUT):
+    """
+    Klik tombol submit lalu tunggu sampai dokumen hasil POST siap.
+
+    Selesai begitu dokumen lama sudah diganti (elemen <html> lama stale) dan
+    dokumen baru tidak lagi `loading` -- mencakup redirect (URL berubah) dan
+    halaman yang dirender ulang dengan alert. Jika validasi HTML5 form gagal
+    (mis. input type=email), browser tidak mengirim form sehingga tidak ada
+    yang perlu ditunggu. Server-Timing dokumen baru dicatat untuk halaman
+    tersebut; setelah redirect itu header dokumen tujuan, bukan respons POST.
+    """
+    def new_document_ready(d):
+        try:
+            d.execute_script("return arguments[0].tagName;", old_html)
+            return False
+        except (StaleElementReferenceException, NoSuchElementException):
+            result = d.execute_script(_SUBMITTED_JS)
+            return result if result["state"] != "loading" else False
+
+    with phase("submit"):
+        will_submit = driver.execute_script(
+            "return !arguments[0].form || arguments[0].form.checkValidity();", button
+        )
+        old_html = driver.find_element(By.TAG_NAME, "html")
+        button.click()
+        if will_submit:
+            result = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(new_document_ready)
+    if will_submit:
+        record_server_timing(result["page"], result["server"])
+
+
+# =========================
+# PENGISIAN FORM
+# =========================
+# Nilai di-set langsung lalu event input/change dikirim, seperti saat user mengetik
+_FILL_JS = """
+const missing = [];
+for (const [id, value] of Object.entries(arguments[0])) {
+    const el = document.getElementById(id);
+    if (!el) { missing.push(id); continue; }
+    el.focus();
+    el.value = value;
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+if (document.activeElement) document.activeElement.blur();
+return missing;
+"""
+
+
+def fill_fields(driver, values: dict, keystrokes: bool = None):
+    """
+    Isi field form berdasarkan id -> nilai. Default satu round trip ke
+    chromedriver berapa pun panjang inputnya; `keystrokes=True` (atau
+    FILL_MODE=keys) memakai clear + send_keys per field.
+    """
+    if keystrokes is None:
+        keystrokes = FILL_MODE == "keys"
+    if keystrokes:
+        for element_id, value in values.items():
+            element = driver.find_element(By.ID, element_id)
+            element.clear()
+            element.send_keys(value)
+        return
+    missing = driver.execute_script(_FILL_JS, values)
+    if missing:
+        raise NoSuchElementException(f"Elemen tidak ditemukan: {missing}")
+
+
+# =========================
+# PROBE HASIL HALAMAN
+# =========================
+# Satu execute_script: hanya ringkasan kecil yang dikirim balik, bukan seluruh DOM
+_PROBE_JS = """
+const html = document.documentElement ? document.documentElement.outerHTML.toLowerCase() : '';
+const alert = document.querySelector('.alert-danger');
+const validate = document.querySelector('.text-danger');
+const found = {};
+for (const text of arguments[0]) found[text] = html.includes(text);
+return {
+    url: location.href,
+    alert: alert ? alert.textContent.trim() : '',
+    validate: validate ? validate.textContent.trim() : '',
+    has_password: !!document.querySelector("input[type='password']"),
+    found: found,
+};
+"""
+
+
+@dataclass
+class PageState:
+    url: str
+    alert: str = ""
+    validate: str = ""
+    has_password: bool = False
+    found: dict = field(default_factory=dict)
+
+    def has_text(self, text: str) -> bool:
+        return self.found.get(text.lower(), False)
+
+
+def probe_page(driver, *texts: str) -> PageState:
+    """
+    URL, teks alert-danger, teks validasi, ada tidaknya field password, dan
+    apakah `texts` muncul di halaman (case-insensitive) -- dalam satu round trip.
+    """
+    result = driver.execute_script(_PROBE_JS, [t.lower() for t in texts])
+    return PageState(**result)
+
+
+# =========================
+# POOL DRIVER
+# =========================
+class DriverPool:
+    """
+    Pool browser per proses pytest (per worker bila paralel).
+
+    Browser yang sudah jalan dipinjamkan ke test berikutnya setelah di-reset,
+    sehingga Chrome hanya di-start sekali per `recycle_after` test. Dengan
+    isolation="context" setiap peminjaman mendapat browser context baru dan
+    context tersebut dibuang saat dikembalikan. Memori browser diukur lewat
+    `memory` (MemoryGuard): browser baru menunggu budget, browser yang terlalu
+    besar di-restart.
+    """
+
+    def __init__(self, headless: bool = False, recycle_after: int = DRIVER_RECYCLE_AFTER,
+                 isolation: str = BROWSER_ISOLATION, memory: MemoryGuard = None):
+        if isolation not in ("reset", "context"):
+            raise ValueError(f"BROWSER_ISOLATION tidak dikenal: {isolation} (pilihan: reset, context)")
+        self.headless = headless
+        self.recycle_after = recycle_after
+        self.isolation = isolation
+        self.memory = memory or MemoryGuard()
+        self._idle = []
+        self._uses = {}
+        self._home = {}
+        self._contexts = {}
+
+    def acquire(self):
+        if self._idle:
+            driver = self._idle.pop()
+        else:
+            self.memory.wait_for_room(self.memory.publish(self._uses))
+            try:
+                driver = create_chrome_driver(headless=self.headless)
+            except Exception:
+                self.memory.publish(self._uses)  # lepas reservasi budget
+                raise
+            self._uses[driver] = 0
+            self._home[driver] = driver.current_window_handle
+            self.memory.publish(self._uses)
+        self._uses[driver] += 1
+        if self.isolation == "context":
+            try:
+                self._contexts[driver] = open_context(driver)
+            except WebDriverException:
+                self._discard(driver)
+                raise
+        return driver
+
+    def release(self, driver):
+        recycle = bool(self.recycle_after) and self._uses[driver] >= self.recycle_after
+        # Satu pengukuran per release; publish() di bawah memakai ukuran yang sama
+        recycle = self.memory.over_limit(self.memory.measure(driver)) or recycle
+        try:
+            context_id = self._contexts.pop(driver, None)
+            if context_id:
+                close_context(driver, context_id, self._home[driver])
+            if recycle:
+                self._discard(driver)
+                return
+            if not context_id:
+                reset_driver(driver)
+        except WebDriverException:
+            # Browser crash / alert menggantung -> buang, nanti dibuat baru
+            self._discard(driver)
+            return
+        finally:
+            self.memory.publish(self._uses)
+        self._idle.append(driver)
+
+    def close(self):
+        while self._idle:
+            self._discard(self._idle.pop())
+        self.memory.close()
+
+    def _discard(self, driver):
+        self._uses.pop(driver, None)
+        self._home.pop(driver, None)
+        self._contexts.pop(driver, None)
+        self.memory.forget(driver)
+        try:
+            quit_driver(driver)
+        except WebDriverException:
+            pass
@@ -0,0 +1,208 @@
+"""
+Memori browser: RSS seluruh pohon proses (chromedriver + Chrome + renderer)
+per browser, budget total yang dibagi semua worker di mesin yang sama lewat
+file ledger, dan puncak memori per worker.
+"""
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:  # opsional: tanpa psutil memori browser tidak dipantau
+    psutil = None
+
+from accounts import WORKER_ID
+
+
+# =========================
+# KONFIGURASI
+# =========================
+# Total memori semua browser di mesin ini (MB, 0 = tanpa batas). Bila penuh,
+# worker yang butuh browser baru menunggu sampai worker lain melepas memori.
+BROWSER_MEMORY_BUDGET_MB = int(os.getenv("BROWSER_MEMORY_BUDGET_MB", "0"))
+
+# Browser yang memakai lebih dari N MB di-restart setelah test (0 = tidak pernah)
+BROWSER_MEMORY_RECYCLE_MB = int(os.getenv("BROWSER_MEMORY_RECYCLE_MB", "0"))
+
+# Perkiraan memori browser baru sebelum ada browser yang pernah diukur
+BROWSER_MEMORY_ESTIMATE_MB = int(os.getenv("BROWSER_MEMORY_ESTIMATE_MB", "300"))
+
+# Batas waktu menunggu budget (detik) sebelum test dinyatakan error
+BROWSER_MEMORY_WAIT = float(os.getenv("BROWSER_MEMORY_WAIT", "600"))
+
+# File ledger bersama; default satu file per mesin sehingga run paralel lain ikut dihitung
+BROWSER_MEMORY_LEDGER = os.getenv(
+    "BROWSER_MEMORY_LEDGER", os.path.join(tempfile.gettempdir(), "browser-memory-ledger.json")
+)
+
+MB = 1024 * 1024
+
+
+# =========================
+# PENGUKURAN
+# =========================
+def process_tree_rss(pid: int) -> int:
+    """RSS (byte) proses `pid` beserta seluruh turunannya."""
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return 0
+    total = 0
+    for proc in processes:
+        try:
+            total += proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return total
+
+
+def driver_rss_mb(driver) -> float:
+    """Memori browser milik `driver`: chromedriver dan semua proses Chrome turunannya."""
+    process = getattr(driver.service, "process", None)
+    return process_tree_rss(process.pid) / MB if process else 0.0
+
+
+# =========================
+# LEDGER ANTAR WORKER
+# =========================
+class MemoryLedger:
+    """
+    File JSON {pid: {"worker": ..., "mb": ...}} bersama semua proses pytest.
+    Setiap baca-tulis dilakukan di bawah lock file (O_EXCL, juga jalan di
+    Windows); entri milik proses yang sudah mati diabaikan.
+    """
+
+    STALE_LOCK = 10.0
+
+    def __init__(self, path: str = BROWSER_MEMORY_LEDGER):
+        self.path = path
+        self.lock_path = path + ".lock"
+
+    @contextmanager
+    def _locked(self):
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    # Lock ditinggal proses yang mati di tengah update
+                    if time.time() - os.path.getmtime(self.lock_path) > self.STALE_LOCK:
+                        os.remove(self.lock_path)
+                except FileNotFoundError:
+                    pass
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            os.remove(self.lock_path)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return {pid: e for pid, e in entries.items() if psutil.pid_exists(int(pid))}
+
+    def _write(self, entries: dict):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp, self.path)
+
+    def set(self, worker: str, mb: float):
+        with self._locked():
+            entries = self._read()
+            entries[str(os.getpid())] = {"worker": worker, "mb": round(mb, 1)}
+            self._write(entries)
+
+    def remove(self):
+        with self._locked():
+            entries = self._read()
+            entries.pop(str(os.getpid()), None)
+            self._write(entries)
+
+    def try_reserve(self, worker: str, current_mb: float, need_mb: float, budget_mb: float) -> bool:
+        """Catat current+need untuk proses ini bila masih muat di budget (selalu muat bila sendirian)."""
+        with self._locked():
+            entries = self._read()
+            others = sum(e["mb"] for pid, e in entries.items() if pid != str(os.getpid()))
+            if others and others + current_mb + need_mb > budget_mb:
+                return False
+            entries[str(os.getpid())] = {"worker": worker, "mb": round(current_mb + need_mb, 1)}
+            self._write(entries)
+            return True
+
+
+# =========================
+# PENJAGA MEMORI POOL
+# =========================
+class MemoryGuard:
+    """Pengukuran, budget, dan batas recycle memori untuk satu DriverPool."""
+
+    def __init__(self, budget_mb: int = BROWSER_MEMORY_BUDGET_MB, recycle_mb: int = BROWSER_MEMORY_RECYCLE_MB,
+                 estimate_mb: int = BROWSER_MEMORY_ESTIMATE_MB, wait: float = BROWSER_MEMORY_WAIT,
+                 ledger_path: str = BROWSER_MEMORY_LEDGER):
+        if (budget_mb or recycle_mb) and psutil is None:
+            raise RuntimeError("psutil belum terpasang (dibutuhkan BROWSER_MEMORY_*): pip install -r requirements.txt")
+        self.enabled = psutil is not None
+        self.budget_mb = budget_mb
+        self.recycle_mb = recycle_mb
+        self.estimate_mb = estimate_mb
+        self.wait = wait
+        self.ledger = MemoryLedger(ledger_path) if budget_mb else None
+        self.worker = WORKER_ID or "main"
+        self.peak_mb = 0.0
+        self.largest_mb = 0.0
+        # Ukuran terakhir per browser; pohon proses hanya ditelusuri di measure()
+        self._sizes = {}
+
+    def measure(self, driver) -> float:
+        if not self.enabled:
+            return 0.0
+        mb = driver_rss_mb(driver)
+        self._sizes[driver] = mb
+        self.largest_mb = max(self.largest_mb, mb)
+        return mb
+
+    def forget(self, driver):
+        self._sizes.pop(driver, None)
+
+    def publish(self, drivers) -> float:
+        """
+        Total MB browser milik pool dari ukuran terakhir masing-masing (browser
+        yang belum pernah diukur diukur sekarang), perbarui puncak dan ledger.
+        """
+        if not self.enabled:
+            return 0.0
+        total = sum(self._sizes[d] if d in self._sizes else self.measure(d) for d in drivers)
+        self.peak_mb = max(self.peak_mb, total)
+        if self.ledger:
+            self.ledger.set(self.worker, total)
+        return total
+
+    def wait_for_room(self, current_mb: float):
+        """Antre sampai ada ruang di budget untuk satu browser baru."""
+        if not self.ledger:
+            return
+        need = self.largest_mb or self.estimate_mb
+        deadline = time.monotonic() + self.wait
+        while not self.ledger.try_reserve(self.worker, current_mb, need, self.budget_mb):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Budget memori browser {self.budget_mb} MB masih penuh setelah {self.wait:.0f} detik"
+                )
+            time.sleep(0.5)
+
+    def over_limit(self, mb: float) -> bool:
+        return bool(self.recycle_mb) and mb > self.recycle_mb
+
+    def close(self):
+        if self.ledger:
+            self.ledger.remove()
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+
+from accounts import VALID_PASSWORD, VALID_USERNAME, unique_suffix
+
+
+# =========================
+# DEFINISI TEST CASE
+# =========================
+# Setiap case = satu atau beberapa kali submit form. Nilai field boleh berisi
+# placeholder {a} / {b} (suffix unik per eksekusi), {u} (VALID_USERNAME) dan
+# {p} (VALID_PASSWORD). expect per langkah:
+#   "fail"    -> form harus ditolak (tetap di halaman yang sama)
+#   "success" -> form harus diterima (redirect)
+#   None      -> hanya dicatat sebagai temuan, test selalu PASS
+@dataclass(frozen=True)
+class Case:
+    id: str
+    page: str
+    steps: tuple
+    # True jika hasilnya ditentukan browser (mis. validasi HTML5 type=email),
+    # sehingga tidak bisa dijalankan tanpa browser
+    browser_only: bool = False
+
+    def values(self) -> dict:
+        return {"a": unique_suffix(), "b": unique_suffix(), "u": VALID_USERNAME, "p": VALID_PASSWORD}
+
+
+def login(username, password):
+    return {"username": username, "password": password}
+
+
+def register(name, email, username, password="pass123", repassword="pass123"):
+    return {"name": name, "email": email, "username": username,
+            "password": password, "repassword": repassword}
+
+
+SQLI = "' OR '1'='1"
+XSS = "<script>alert(1)</script>"
+
+LOGIN_CASES = [
+    Case("TC-L-01", "login.php", ((login("{u}", "{p}"), None),)),
+    Case("TC-L-02", "login.php", ((login("{u}", "salah123"), "fail"),)),
+    Case("TC-L-03", "login.php", ((login("", "{p}"), "fail"),)),
+    Case("TC-L-04", "login.php", ((login(SQLI, "pass123"), None),)),
+    Case("TC-L-05", "login.php", ((login("{u}", ""), "fail"),)),
+    Case("TC-L-06", "login.php", ((login("", ""), "fail"),)),
+    Case("TC-L-07", "login.php", ((login(" {u} ", "{p}"), "fail"),)),
+    Case("TC-L-08", "login.php", ((login("{u}", " {p} "), "fail"),)),
+    Case("TC-L-09", "login.php", ((login(VALID_USERNAME.capitalize(), "{p}"), "fail"),)),
+    Case("TC-L-10", "login.php", ((login("{u}", "PASS123"), "fail"),)),
+    Case("TC-L-11", "login.php", ((login("{u}!", "{p}"), "fail"),)),
+    Case("TC-L-12", "login.php", ((login("{u}", "{p}!"), "fail"),)),
+    Case("TC-L-13", "login.php", ((login("{u}", SQLI), None),)),
+    Case("TC-L-14", "login.php", ((login(SQLI, SQLI), None),)),
+    Case("TC-L-15", "login.php", ((login(XSS, "{p}"), "fail"),)),
+    Case("TC-L-16", "login.php", ((login("{u}", XSS), "fail"),)),
+    Case("TC-L-17", "login.php", ((login("u" * 200, "{p}"), "fail"),)),
+    Case("TC-L-18", "login.php", ((login("{u}", "p" * 500), "fail"),)),
+    Case("TC-L-19", "login.php", ((login("user_tidak_ada_123", "pass123"), "fail"),)),
+    Case("TC-L-20", "login.php", ((login("{u}", "salah123"), "fail"),) * 5),
+]
+
+REGISTER_CASES = [
+    Case("TC-R-01", "register.php", ((register("User Otomatis", "user_{a}@mail.com", "user_{a}"), "success"),)),
+    Case("TC-R-02", "register.php", ((register("", "user_{a}@mail.com", "user_{a}"), "fail"),)),
+    Case("TC-R-03", "register.php", ((register("User Otomatis", "", "user_{a}"), "fail"),)),
+    Case("TC-R-04", "register.php", ((register("User Otomatis", "user@mail.com", ""), "fail"),)),
+    Case("TC-R-05", "register.php", ((register("User Otomatis", "user_{a}@mail.com", "user_{a}", password=""), "fail"),)),
+    Case("TC-R-06", "register.php", ((register("User Otomatis", "sqli_{a}@mail.com", SQLI), None),)),
+    Case("TC-R-07", "register.php", ((register("User Otomatis", "user_{a}@mail.com", "user_{a}", repassword=""), None),)),
+    Case("TC-R-08", "register.php", ((register("User Otomatis", "user_{a}@mail.com", "user_{a}", repassword="pass124"), "fail"),)),
+    Case("TC-R-09", "register.php", ((register("User Otomatis", "usergmail.com", "user_{a}"), "fail"),), browser_only=True),
+    Case("TC-R-10", "register.php", ((register("User Otomatis", "user@", "user_{a}"), "fail"),), browser_only=True),
+    Case("TC-R-11", "register.php", (
+        (register("User Otomatis", "dup_{a}@mail.com", "user_{a}"), "success"),
+        (register("User Otomatis", "dup_{a}@mail.com", "user_{b}"), "fail"),
+    )),
+    Case("TC-R-12", "register.php", (
+        (register("User Otomatis", "userdup_{a}@mail.com", "userdup_{a}"), "success"),
+        (register("User Otomatis", "userdup_{a}_{b}@mail.com", "userdup_{a}"), "fail"),
+    )),
+    Case("TC-R-13", "register.php", ((register("User Otomatis", "space_{b}@mail.com", "user {a}"), None),)),
+    Case("TC-R-14", "register.php", ((register("User Otomatis", "spec_{b}@mail.com", "user_spec_{a}"), None),)),
+    Case("TC-R-15", "register.php", ((register("User Dengan Nama Panjang", "user_{a}@mail.com", "user_{a}"), None),)),
+    Case("TC-R-16", "register.php", ((register("User Otomatis", "longu_{b}@mail.com", "user_{a}"), None),)),
+    Case("TC-R-17", "register.php", ((register("User Otomatis", "user_{a}@mail.com", "user_{a}", "1", "1"), None),)),
+    Case("TC-R-18", "register.php", ((register("User Otomatis", "user_{a}@mail.com", "user_{a}", " pass123 ", " pass123 "), None),)),
+    Case("TC-R-19", "register.php", ((register("Test XSS User", "user_{a}@mail.com", "user_{a}"), None),)),
+    # type=email menolak domain berisi spasi/kutip sebelum form terkirim
+    Case("TC-R-20", "register.php", ((register("User Otomatis", "test@mail.com' OR '1'='1", "user_{a}"), None),), browser_only=True),
+]
+
+ALL_CASES = LOGIN_CASES + REGISTER_CASES
+
+
+def case_id_from_test_name(name: str) -> str:
+    """test_TC_L_02_login_wrong_password -> TC-L-02"""
+    parts = name.split("_")
+    return "-".join(parts[1:4]) if name.startswith("test_TC_") else ""
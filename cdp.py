@@ -0,0 +1,144 @@
+"""
+Klien Chrome DevTools Protocol minimal di atas asyncio (stdlib saja).
+
+Satu koneksi WebSocket ke endpoint browser (`webSocketDebuggerUrl`).
+Perintah untuk tab tertentu dikirim dengan `session_id` hasil
+Target.attachToTarget(flatten=True), sehingga banyak tab dikendalikan
+bersamaan lewat satu koneksi. Event DevTools diabaikan; hanya respons
+perintah yang diteruskan ke pemanggil.
+"""
+import asyncio
+import base64
+import json
+import os
+import struct
+from urllib.parse import urlsplit
+
+OP_TEXT, OP_CLOSE, OP_PING, OP_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+class CDPError(RuntimeError):
+    """Perintah DevTools dibalas dengan error (mis. target sudah ditutup)."""
+
+
+# =========================
+# FRAME WEBSOCKET (RFC 6455)
+# =========================
+def apply_mask(payload: bytes, mask: bytes) -> bytes:
+    n = len(payload)
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")).to_bytes(n, "little")
+
+
+def encode_frame(payload: bytes, opcode: int = OP_TEXT) -> bytes:
+    """Frame tunggal (FIN) dari klien; klien wajib memakai mask."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, 0x80 | n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, n)
+    mask = os.urandom(4)
+    return header + mask + apply_mask(payload, mask)
+
+
+# =========================
+# KONEKSI
+# =========================
+class CDPConnection:
+    def __init__(self, reader, writer, timeout: float = 10.0):
+        self.timeout = timeout
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._pending = {}
+        self._read_task = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, ws_url: str, timeout: float = 10.0):
+        parts = urlsplit(ws_url)
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(parts.hostname, parts.port), timeout)
+        key = base64.b64encode(os.urandom(16)).decode()
+        # Tanpa header Origin: Chrome menolak Origin yang tidak ada di --remote-allow-origins
+        writer.write((
+            f"GET {parts.path} HTTP/1.1\r\nHost: {parts.hostname}:{parts.port}\r\n"
+            f"Upgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode())
+        await writer.drain()
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+        if b" 101 " not in head.split(b"\r\n", 1)[0]:
+            writer.close()
+            raise CDPError(f"Handshake WebSocket ke {ws_url} ditolak: {head.splitlines()[0].decode(errors='replace')}")
+        return cls(reader, writer, timeout)
+
+    async def send(self, method: str, params: dict = None, session_id: str = None) -> dict:
+        """Kirim satu perintah dan tunggu `result`-nya."""
+        self._next_id += 1
+        message = {"id": self._next_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        self._writer.write(encode_frame(json.dumps(message).encode()))
+        await self._writer.drain()
+        try:
+            response = await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(message["id"], None)
+        if "error" in response:
+            raise CDPError(f"{method}: {response['error'].get('message', response['error'])}")
+        return response.get("result", {})
+
+    async def close(self):
+        self._read_task.cancel()
+        try:
+            self._writer.write(encode_frame(b"", OP_CLOSE))
+            self._writer.close()
+            await self._writer.wait_closed()
+        except (OSError, RuntimeError):
+            pass
+
+    async def _read_message(self):
+        """Satu pesan teks utuh (frame lanjutan digabung); None bila server menutup koneksi."""
+        chunks = []
+        while True:
+            b0, b1 = await self._reader.readexactly(2)
+            opcode, n = b0 & 0x0F, b1 & 0x7F
+            if n == 126:
+                n = struct.unpack("!H", await self._reader.readexactly(2))[0]
+            elif n == 127:
+                n = struct.unpack("!Q", await self._reader.readexactly(8))[0]
+            mask = await self._reader.readexactly(4) if b1 & 0x80 else None
+            payload = await self._reader.readexactly(n)
+            if mask:
+                payload = apply_mask(payload, mask)
+            if opcode == OP_CLOSE:
+                return None
+            if opcode == OP_PING:
+                self._writer.write(encode_frame(payload, OP_PONG))
+                continue
+            if opcode == OP_PONG:
+                continue
+            chunks.append(payload)
+            if b0 & 0x80:
+                return b"".join(chunks)
+
+    async def _read_loop(self):
+        error = ConnectionError("Koneksi DevTools tertutup")
+        try:
+            while True:
+                message = await self._read_message()
+                if message is None:
+                    break
+                data = json.loads(message)
+                future = self._pending.get(data.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(data)
+        except (OSError, asyncio.IncompleteReadError) as err:
+            error = ConnectionError(f"Koneksi DevTools terputus: {err}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
@@ -0,0 +1,330 @@
+import os
+
+import pytest
+
+import database
+import nav_timing
+import query_log as querylog
+import timing
+import timing_history
+from accounts import VALID_PASSWORD, VALID_USERNAME, WORKER_ID
+from browser import HEADLESS, DriverPool
+from cases import ALL_CASES, case_id_from_test_name
+from http_engine import ENGINE, ensure_account
+from stub_server import start_stub_server
+
+
+# =========================
+# STUB SERVER (STUB_SERVER=1)
+# =========================
+def pytest_configure(config):
+    """
+    STUB_SERVER=1: jalankan stub server di port acak sebelum modul test di-import,
+    lalu arahkan BASE_URL ke sana. Setiap worker xdist punya stub (dan data user) sendiri.
+    """
+    if os.getenv("STUB_SERVER", "0") == "1":
+        config.stub_server = start_stub_server()
+        os.environ["BASE_URL"] = config.stub_server.base_url
+    if ENGINE == "tabs" and getattr(config.option, "numprocesses", None) and config.option.dist != "loadgroup":
+        # Tanpa loadgroup setiap worker melihat seluruh koleksi dan menjalankan semua case di browser-nya
+        raise pytest.UsageError("ENGINE=tabs dengan -n butuh --dist loadgroup (semua case di tab satu browser)")
+    try:
+        config.perf_budgets = nav_timing.parse_budgets()
+    except ValueError as err:
+        raise pytest.UsageError(str(err)) from None
+    config.nav_samples = []
+    config.server_samples = []
+
+
+def pytest_unconfigure(config):
+    stub = getattr(config, "stub_server", None)
+    if stub is not None:
+        stub.stop()
+
+
+@pytest.fixture(scope="session")
+def stub_server(request):
+    """Stub server yang sedang dipakai (STUB_SERVER=1), atau stub baru khusus test ini."""
+    stub = getattr(request.config, "stub_server", None)
+    if stub is not None:
+        yield stub
+        return
+    stub = start_stub_server()
+    yield stub
+    stub.stop()
+
+
+# =========================
+# DRIVER (POOL)
+# =========================
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    pool = DriverPool(headless=HEADLESS)
+    yield pool
+    pool.close()
+    _record_browser_peak(request.config, WORKER_ID or "main", pool.memory.peak_mb)
+
+
+@pytest.fixture
+def driver(driver_pool):
+    with timing.phase("driver"):
+        drv = driver_pool.acquire()
+    yield drv
+    with timing.phase("reset"):
+        driver_pool.release(drv)
+
+
+# =========================
+# AKUN PER WORKER
+# =========================
+@pytest.fixture(scope="session")
+def worker_account():
+    """Saat dijalankan paralel (pytest -n N), pastikan akun login milik worker ini ada."""
+    if WORKER_ID:
+        ensure_account(VALID_USERNAME, VALID_PASSWORD)
+    return VALID_USERNAME, VALID_PASSWORD
+
+
+# =========================
+# DATABASE (DB_RESET=test|session)
+# =========================
+@pytest.fixture(scope="session")
+def db():
+    """Koneksi MySQL ke database aplikasi (DB_HOST, DB_USER, ... sama dengan koneksi.php)."""
+    conn = database.connect()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def users_snapshot(db):
+    """Snapshot tabel users; restore_added() / restore_full() mengembalikan isinya."""
+    return database.TableSnapshot(db).take()
+
+
+@pytest.fixture(autouse=True)
+def _reset_users_table(request):
+    """
+    DB_RESET=test: hapus baris users yang dibuat test setelah test selesai.
+    Saat paralel tidak dilakukan per test (worker lain masih memakai datanya);
+    tabel dikembalikan sekali oleh proses utama di akhir run.
+    """
+    yield
+    if database.DB_RESET == "test" and not WORKER_ID:
+        request.getfixturevalue("users_snapshot").restore_added()
+
+
+# =========================
+# LOG QUERY (QUERY_LOG=...)
+# =========================
+@pytest.fixture
+def query_log():
+    """
+    Query SQL setiap request http_engine milik test ini (QUERY_LOG harus diisi
+    sama di environment PHP/stub dan pytest), mis.
+    `query_log.requests("login.php")[-1]["queries"]`.
+    """
+    if not querylog.QUERY_LOG:
+        pytest.skip("Set QUERY_LOG=<file> di environment PHP (atau stub server) dan pytest")
+    with querylog.capture() as log:
+        yield log
+
+
+# =========================
+# PEMILIHAN ENGINE
+# =========================
+# Case yang sudah dijalankan engine lain -> test Selenium-nya di-skip
+ENGINE_CASE_IDS = {
+    "http": ({c.id for c in ALL_CASES if not c.browser_only}, "tanpa browser di test_http_matrix.py"),
+    "tabs": ({c.id for c in ALL_CASES}, "di tab paralel oleh test_tab_matrix.py"),
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    ENGINE=http: test Selenium yang case-nya sudah dijalankan test_http_matrix.py
+    di-skip, sehingga browser hanya dipakai untuk case yang benar-benar butuh browser.
+    ENGINE=tabs: semua case dijalankan test_tab_matrix.py, test Selenium per case di-skip.
+    """
+    if ENGINE not in ENGINE_CASE_IDS:
+        return
+    case_ids, where = ENGINE_CASE_IDS[ENGINE]
+    skip = pytest.mark.skip(reason=f"ENGINE={ENGINE}: case dijalankan {where}")
+    for item in items:
+        if case_id_from_test_name(item.name) in case_ids:
+            item.add_marker(skip)
+
+
+# =========================
+# TIMING PER FASE
+# =========================
+def _is_controller(config) -> bool:
+    return not hasattr(config, "workerinput")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    if not _is_controller(session.config):
+        return
+    if timing.TIMINGS_FILE and os.path.exists(timing.TIMINGS_FILE):
+        os.remove(timing.TIMINGS_FILE)
+    if querylog.QUERY_LOG and os.path.exists(querylog.QUERY_LOG):
+        # Log run sebelumnya; QueryLog.requests() membaca ulang seluruh file setiap dipanggil
+        os.remove(querylog.QUERY_LOG)
+    if database.DB_RESET != "off":
+        # Snapshot dibuat sekali (oleh proses utama) dari kondisi setelah seeding,
+        # lalu sisa run sebelumnya dibersihkan
+        session.config.users_snapshot = database.TableSnapshot(database.connect()).take()
+        session.config.users_snapshot.restore_full()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    snapshot = getattr(config, "users_snapshot", None)
+    if snapshot is not None:
+        snapshot.restore_full()
+        snapshot.conn.close()
+    if not _is_controller(config):
+        config.workeroutput["nav_samples"] = config.nav_samples
+        config.workeroutput["server_samples"] = config.server_samples
+        return
+    if timing_history.TIMING_HISTORY and timing.TIMINGS_FILE and os.path.exists(timing.TIMINGS_FILE):
+        # timings.jsonl sudah berisi record semua worker -> satu run di riwayat
+        conn = timing_history.connect()
+        timing_history.record_run(conn, timing_history.load_records(), engine=ENGINE)
+        conn.close()
+    # Budget dicek sekali di proses utama atas sampel gabungan semua worker
+    config.perf_violations = nav_timing.check_budgets(config.nav_samples + config.server_samples, config.perf_budgets)
+    if config.perf_violations and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    item.phase_timer = timing.start()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    report = yield
+    timer = getattr(item, "phase_timer", None)
+    if timer is None:
+        return report
+    report.phase_timings = timer.as_ms()
+    report.server_timings = timer.server_ms()
+    if report.when == "call" or report.outcome != "passed":
+        item.timing_outcome = report.outcome
+    if report.when == "teardown":
+        timing.stop()
+        item.config.nav_samples.extend(timer.navigations)
+        item.config.server_samples.extend(timer.server_timings)
+        timing.write_record({
+            "test": item.nodeid,
+            "outcome": getattr(item, "timing_outcome", report.outcome),
+            "worker": WORKER_ID or "main",
+            "engine": ENGINE,
+            "started": round(timer.started, 3),
+            "phases_ms": report.phase_timings,
+            "navigation": timer.navigations,
+            "server_timing": timer.server_timings,
+        })
+    return report
+
+
+# Laporan call yang menunggu laporan teardown-nya (per nodeid, di proses utama)
+_call_reports = {}
+
+
+def pytest_runtest_logreport(report):
+    """
+    Fase `reset` (teardown fixture driver) baru tercatat setelah laporan call
+    dibuat. pytest-html (trylast) membuat baris tabel saat laporan teardown
+    tiba, jadi total akhir dari laporan teardown disalin dulu ke laporan call.
+    """
+    if not hasattr(report, "phase_timings"):
+        return
+    if report.when == "call":
+        _call_reports[report.nodeid] = report
+    elif report.when == "teardown":
+        call = _call_reports.pop(report.nodeid, None)
+        if call is not None:
+            call.phase_timings = report.phase_timings
+            call.server_timings = report.server_timings
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_header(cells):
+    cells.extend(f'<th class="sortable" data-column-type="{name}">{name} (ms)</th>' for name in timing.PHASES)
+    cells.extend(f'<th class="sortable" data-column-type="server-{name}">server {name} (ms)</th>'
+                 for name in nav_timing.SERVER_METRICS)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    phases = getattr(report, "phase_timings", {})
+    cells.extend(f'<td class="col-{name}">{phases.get(name, "")}</td>' for name in timing.PHASES)
+    server = getattr(report, "server_timings", {})
+    cells.extend(f'<td class="col-server-{name}">{server.get(name, "")}</td>' for name in nav_timing.SERVER_METRICS)
+
+
+# =========================
+# MEMORI BROWSER PER WORKER
+# =========================
+def _record_browser_peak(config, worker: str, peak_mb: float):
+    """Worker xdist mengirim puncaknya ke proses utama lewat workeroutput."""
+    if not peak_mb:
+        return
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["browser_peak_mb"] = peak_mb
+    else:
+        config.browser_peaks = {**getattr(config, "browser_peaks", {}), worker: peak_mb}
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+    node.config.nav_samples.extend(output.get("nav_samples", []))
+    node.config.server_samples.extend(output.get("server_samples", []))
+    peak_mb = output.get("browser_peak_mb")
+    if peak_mb:
+        _record_browser_peak(node.config, node.gateway.id, peak_mb)
+
+
+def _browser_peak_lines(config):
+    peaks = getattr(config, "browser_peaks", {})
+    return [f"{worker}: {mb:.0f} MB" for worker, mb in sorted(peaks.items())]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    lines = _browser_peak_lines(config)
+    if lines:
+        terminalreporter.write_sep("-", "memori browser puncak per worker")
+        for line in lines:
+            terminalreporter.write_line(line)
+    if config.nav_samples:
+        terminalreporter.write_sep("-", "navigation timing (ms)")
+        for line in nav_timing.summary_lines(config.nav_samples):
+            terminalreporter.write_line(line)
+    if config.server_samples:
+        terminalreporter.write_sep("-", "server timing (ms)")
+        for line in nav_timing.server_summary_lines(config.server_samples):
+            terminalreporter.write_line(line)
+    for violation in getattr(config, "perf_violations", []):
+        terminalreporter.write_line(f"BUDGET TERLAMPAUI: {violation}", red=True, bold=True)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    config = session.config
+    lines = _browser_peak_lines(config)
+    if lines:
+        prefix.append(f"<p>Memori browser puncak per worker: {', '.join(lines)}</p>")
+    if config.nav_samples:
+        table = "\n".join(nav_timing.summary_lines(config.nav_samples))
+        prefix.append(f"<p>Navigation timing (ms):</p><pre>{table}</pre>")
+    if config.server_samples:
+        table = "\n".join(nav_timing.server_summary_lines(config.server_samples))
+        prefix.append(f"<p>Server timing (ms):</p><pre>{table}</pre>")
+    for violation in getattr(config, "perf_violations", []):
+        prefix.append(f'<p class="failed">Budget terlampaui: {violation}</p>')
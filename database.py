@@ -0,0 +1,115 @@
+"""
+Akses MySQL untuk test: koneksi dan snapshot/restore tabel users.
+
+    python database.py snapshot [--refresh]   # simpan kondisi users saat ini (setelah seeding)
+    python database.py restore                # kembalikan users ke snapshot
+"""
+import argparse
+import os
+import time
+
+try:
+    import pymysql
+except ImportError:  # hanya dibutuhkan bila fitur database dipakai
+    pymysql = None
+
+
+# =========================
+# KONFIGURASI (sama dengan koneksi.php)
+# =========================
+DB_HOST = os.getenv("DB_HOST", "localhost")
+DB_PORT = int(os.getenv("DB_PORT", "3306"))
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "")
+DB_NAME = os.getenv("DB_NAME", "quiz_pengupil")
+
+# off     -> database tidak disentuh
+# test    -> baris baru dihapus setelah setiap test (hanya saat serial)
+# session -> users dikembalikan ke snapshot di awal dan akhir run
+DB_RESET = os.getenv("DB_RESET", "off")
+
+SNAPSHOT_SUFFIX = "__snapshot"
+
+
+def connect(database: str = DB_NAME):
+    if pymysql is None:
+        raise RuntimeError("PyMySQL belum terpasang: pip install -r requirements.txt")
+    return pymysql.connect(
+        host=DB_HOST, port=DB_PORT, user=DB_USER, password=DB_PASSWORD,
+        database=database, autocommit=True, charset="utf8mb4",
+    )
+
+
+# =========================
+# SNAPSHOT TABEL
+# =========================
+class TableSnapshot:
+    """
+    Salinan tabel (`users__snapshot`) di schema yang sama.
+
+    Test hanya menambah baris, jadi restore antar test cukup menghapus baris
+    dengan id di atas id terbesar snapshot (range scan primary key, beberapa
+    milidetik). restore_full() juga mengembalikan baris yang dihapus/diubah dan
+    dipakai di awal/akhir run.
+    """
+
+    def __init__(self, conn, table: str = "users"):
+        self.conn = conn
+        self.table = table
+        self.snapshot = table + SNAPSHOT_SUFFIX
+        self.max_id = 0
+
+    def _execute(self, sql, args=None):
+        with self.conn.cursor() as cur:
+            cur.execute(sql, args)
+            return cur.fetchall()
+
+    def exists(self) -> bool:
+        return bool(self._execute("SHOW TABLES LIKE %s", (self.snapshot,)))
+
+    def take(self, refresh: bool = False):
+        """Buat snapshot dari isi tabel sekarang; snapshot lama dipakai ulang kecuali refresh=True."""
+        if refresh or not self.exists():
+            self._execute(f"DROP TABLE IF EXISTS `{self.snapshot}`")
+            self._execute(f"CREATE TABLE `{self.snapshot}` LIKE `{self.table}`")
+            self._execute(f"INSERT INTO `{self.snapshot}` SELECT * FROM `{self.table}`")
+        self.max_id = self._execute(f"SELECT COALESCE(MAX(id), 0) FROM `{self.snapshot}`")[0][0]
+        return self
+
+    def restore_added(self) -> float:
+        """Hapus baris yang ditambahkan sejak snapshot. Mengembalikan durasi (detik)."""
+        start = time.perf_counter()
+        self._execute(f"DELETE FROM `{self.table}` WHERE id > %s", (self.max_id,))
+        return time.perf_counter() - start
+
+    def restore_full(self) -> float:
+        """Kembalikan tabel persis seperti snapshot (baris baru, terhapus, maupun berubah)."""
+        start = time.perf_counter()
+        columns = [row[0] for row in self._execute(f"SHOW COLUMNS FROM `{self.snapshot}`")]
+        same = " AND ".join(f"t.`{c}` <=> s.`{c}`" for c in columns)
+        self._execute(f"DELETE FROM `{self.table}` WHERE id > %s", (self.max_id,))
+        self._execute(
+            f"DELETE t FROM `{self.table}` t LEFT JOIN `{self.snapshot}` s ON s.id = t.id WHERE s.id IS NULL"
+        )
+        self._execute(
+            f"REPLACE INTO `{self.table}` SELECT s.* FROM `{self.snapshot}` s "
+            f"LEFT JOIN `{self.table}` t ON {same} WHERE t.id IS NULL"
+        )
+        self._execute(f"ALTER TABLE `{self.table}` AUTO_INCREMENT = {self.max_id + 1}")
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot / restore tabel users")
+    parser.add_argument("action", choices=["snapshot", "restore"])
+    parser.add_argument("--refresh", action="store_true", help="timpa snapshot yang sudah ada")
+    args = parser.parse_args()
+    snapshot = TableSnapshot(connect())
+    if args.action == "snapshot":
+        snapshot.take(refresh=args.refresh)
+        print(f"Snapshot {snapshot.snapshot} siap (id maks {snapshot.max_id})")
+    else:
+        if not snapshot.exists():
+            raise SystemExit(f"Snapshot {snapshot.snapshot} belum ada, jalankan 'snapshot' dulu")
+        elapsed = snapshot.take().restore_full()
+        print(f"Tabel {snapshot.table} dikembalikan ke snapshot dalam {elapsed * 1000:.1f} ms")
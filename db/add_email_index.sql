@@ -0,0 +1,6 @@
+-- Untuk database yang di-import sebelum index email ditambahkan ke quiz_pengupil.sql.
+-- register.php hanya menjalankan INSERT dan mengandalkan UNIQUE KEY username & email
+-- untuk menolak duplikat. Hapus dulu email duplikat (jika ada), baris dengan id terkecil dipertahankan.
+DELETE u FROM users u JOIN users d ON d.email = u.email AND d.id < u.id;
+
+ALTER TABLE users ADD UNIQUE KEY `email` (`email`);
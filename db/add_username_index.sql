@@ -0,0 +1,5 @@
+-- Untuk database yang di-import sebelum index username ditambahkan ke quiz_pengupil.sql.
+-- Hapus dulu username duplikat (jika ada), baris dengan id terkecil dipertahankan.
+DELETE u FROM users u JOIN users d ON d.username = u.username AND d.id < u.id;
+
+ALTER TABLE users ADD UNIQUE KEY `username` (`username`);
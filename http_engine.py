@@ -0,0 +1,118 @@
+import html
+import os
+import re
+from dataclasses import dataclass
+
+import urllib3
+
+from accounts import TIMEOUT, base_url
+from nav_timing import parse_server_timing
+from query_log import request_headers
+from timing import phase, record_server_timing
+
+
+# =========================
+# KONFIGURASI
+# =========================
+# ENGINE=selenium (default) -> semua case dijalankan lewat Chrome
+# ENGINE=http               -> case server-side dijalankan lewat POST langsung,
+#                              Selenium hanya untuk case yang butuh browser
+# ENGINE=tabs               -> semua case dijalankan bersamaan di tab-tab satu
+#                              Chrome lewat DevTools (tab_engine.py)
+ENGINE = os.getenv("ENGINE", "selenium")
+
+SUCCESS_TEXT = {
+    "login.php": os.getenv("LOGIN_SUCCESS_TEXT", "logout"),
+    "register.php": os.getenv("REGISTER_SUCCESS_TEXT", "berhasil"),
+}
+
+# Satu pool koneksi keep-alive per proses; redirect tidak diikuti agar
+# header Location bisa dibaca langsung
+_pool = urllib3.PoolManager(maxsize=4, retries=False, timeout=TIMEOUT)
+
+_ALERT_RE = re.compile(r'<div class="alert alert-danger"[^>]*>(.*?)</div>', re.S)
+_VALIDATE_RE = re.compile(r'<p class="text-danger">(.*?)</p>', re.S)
+
+
+# =========================
+# HASIL SUBMIT
+# =========================
+@dataclass
+class Outcome:
+    status: int
+    location: str
+    alert: str
+    validate: str
+    has_password: bool
+    body: str
+
+    @property
+    def redirected(self) -> bool:
+        return 300 <= self.status < 400
+
+
+def submit_form(page: str, fields: dict) -> Outcome:
+    with phase("http"):
+        resp = _pool.request(
+            "POST",
+            f"{base_url()}/{page}",
+            fields={**fields, "submit": ""},
+            headers=request_headers(),
+            encode_multipart=False,
+            redirect=False,
+        )
+    record_server_timing(page, parse_server_timing(resp.headers.get("Server-Timing", "")))
+    body = resp.data.decode("utf-8", "replace")
+    alert = _ALERT_RE.search(body)
+    validate = _VALIDATE_RE.search(body)
+    return Outcome(
+        status=resp.status,
+        location=resp.headers.get("Location", ""),
+        alert=html.unescape(alert.group(1)).strip() if alert else "",
+        validate=html.unescape(validate.group(1)).strip() if validate else "",
+        has_password='type="password"' in body,
+        body=body,
+    )
+
+
+def ensure_account(username: str, password: str):
+    """Buat akun lewat register.php bila login dengan akun tersebut belum berhasil."""
+    if submit_form("login.php", {"username": username, "password": password}).redirected:
+        return
+    outcome = submit_form("register.php", {
+        "name": "Test User",
+        "email": f"{username}@test.com",
+        "username": username,
+        "password": password,
+        "repassword": password,
+    })
+    assert outcome.redirected, (
+        f"Gagal membuat akun worker '{username}' (HTTP {outcome.status}, alert '{outcome.alert}')."
+    )
+
+
+# =========================
+# EKSEKUSI CASE
+# =========================
+def check_outcome(case_id: str, page: str, outcome: Outcome, expect):
+    accepted = outcome.redirected or SUCCESS_TEXT[page].lower() in outcome.body.lower()
+    if expect == "fail":
+        assert not outcome.redirected, (
+            f"{case_id}: {page} seharusnya menolak, tapi redirect ke '{outcome.location}'."
+        )
+    elif expect == "success":
+        assert accepted, (
+            f"{case_id}: {page} seharusnya menerima, tapi tidak redirect "
+            f"(alert '{outcome.alert}', validate '{outcome.validate}')."
+        )
+    elif accepted:
+        print(f"⚠️ {case_id}: input diterima sistem ({outcome.status} -> '{outcome.location}')")
+    else:
+        print(f"✓ {case_id}: input ditolak ('{outcome.alert or outcome.validate}')")
+
+
+def run_case(case):
+    values = case.values()
+    for fields, expect in case.steps:
+        outcome = submit_form(case.page, {k: v.format(**values) for k, v in fields.items()})
+        check_outcome(case.id, case.page, outcome, expect)
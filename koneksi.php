@@ -4,8 +4,139 @@
     $password = '';                  
     $db       = 'quiz_pengupil';
 
-    $con = mysqli_connect($host, $user, $password, $db);
+    // Cost bcrypt untuk password_hash()/password_needs_rehash() (default PHP = 10).
+    // Naik 1 = waktu hash & verify 2x lipat; ukur dengan tools/bench_password_cost.php
+    $password_options = ['cost' => (int) (getenv('PASSWORD_COST') ?: 10)];
+
+    // Query yang gagal (mis. username duplikat) mengembalikan false, bukan exception PHP 8.1+
+    mysqli_report(MYSQLI_REPORT_OFF);
+
+    // Prefix "p:" = koneksi persisten: dipakai ulang oleh proses PHP yang sama
+    // antar request (tanpa handshake TCP + auth setiap request).
+    // DB_PERSISTENT=0 untuk koneksi baru per request (pembanding benchmark).
+    $persistent = getenv('DB_PERSISTENT') !== '0';
+
+    // SERVER_TIMING=1: kirim header Server-Timing (connect, query, hash, verify)
+    // agar test & uji beban bisa melihat bagian request mana yang lambat.
+    //   $t = hrtime(true); ...; timing_add('verify', $t);
+    // Header ditambahkan tepat sebelum header dikirim, jadi halaman harus
+    // menjalankan logikanya sebelum mengeluarkan HTML.
+    $server_timing  = getenv('SERVER_TIMING') === '1';
+    $server_timings = [];
+    function timing_add($name, $start){
+        global $server_timing, $server_timings;
+        if (!$server_timing) return;
+        $server_timings[$name] = ($server_timings[$name] ?? 0) + (hrtime(true) - $start) / 1e6;
+    }
+    if ($server_timing) {
+        header_register_callback(function () {
+            global $server_timings;
+            $metrics = [];
+            foreach ($server_timings as $name => $ms) $metrics[] = sprintf('%s;dur=%.3f', $name, $ms);
+            if ($metrics) header('Server-Timing: ' . implode(', ', $metrics));
+        });
+    }
+
+    $t   = hrtime(true);
+    $con = mysqli_connect(($persistent ? 'p:' : '') . $host, $user, $password, $db);
+    timing_add('connect', $t);
     if (!$con) { 
         die("Connection failed: " . mysqli_connect_error());    
     }
+
+    // QUERY_LOG=/path/queries.jsonl (mode test): setiap request menambah satu baris
+    // JSON berisi semua query db_query: durasi, baris yang dibaca (selisih
+    // Handler_read%), apakah ada full table scan, dan EXPLAIN untuk query yang
+    // lebih lambat dari QUERY_SLOW_MS. Header X-Test-Request dari pytest ikut
+    // dicatat agar fixture query_log bisa memilih request miliknya.
+    $query_log     = getenv('QUERY_LOG') ?: '';
+    $query_slow_ms = (float) (getenv('QUERY_SLOW_MS') ?: 100);
+    $query_entries = [];
+
+    // Total Handler_read% (baris yang dibaca) dan Handler_read_rnd_next (full scan)
+    function handler_reads($con){
+        $reads  = ['rows' => 0, 'scan' => 0];
+        $result = mysqli_query($con, "SHOW SESSION STATUS LIKE 'Handler_read%'");
+        while ($row = mysqli_fetch_row($result)) {
+            $reads['rows'] += (int) $row[1];
+            if ($row[0] === 'Handler_read_rnd_next') $reads['scan'] += (int) $row[1];
+        }
+        return $reads;
+    }
+
+    function query_explain($con, $sql, $types, $params){
+        $stmt = mysqli_prepare($con, "EXPLAIN $sql");
+        if (!$stmt) return null;
+        if ($types !== '') mysqli_stmt_bind_param($stmt, $types, ...$params);
+        $plan = mysqli_stmt_execute($stmt) ? mysqli_fetch_all(mysqli_stmt_get_result($stmt), MYSQLI_ASSOC) : null;
+        mysqli_stmt_close($stmt);
+        return $plan;
+    }
+
+    function query_log_add($con, $sql, $types, $params, $ms, $before){
+        global $query_entries, $query_slow_ms, $query_log_overhead, $db_errno;
+        $after = handler_reads($con);
+        $entry = [
+            'sql'           => $sql,
+            'ms'            => round($ms, 3),
+            'rows_examined' => max(0, $after['rows'] - $before['rows'] - $query_log_overhead['rows']),
+            'full_scan'     => $after['scan'] - $before['scan'] - $query_log_overhead['scan'] > 0,
+            'errno'         => $db_errno,
+        ];
+        if ($ms >= $query_slow_ms) $entry['explain'] = query_explain($con, $sql, $types, $params);
+        $query_entries[] = $entry;
+    }
+
+    if ($query_log) {
+        // SHOW STATUS sendiri ikut menaikkan Handler_read%; diukur sekali lalu dikurangkan
+        $a = handler_reads($con);
+        $b = handler_reads($con);
+        $query_log_overhead = ['rows' => $b['rows'] - $a['rows'], 'scan' => $b['scan'] - $a['scan']];
+        register_shutdown_function(function () {
+            global $query_log, $query_entries;
+            $line = json_encode([
+                'request' => $_SERVER['HTTP_X_TEST_REQUEST'] ?? '',
+                'page'    => basename($_SERVER['SCRIPT_NAME']),
+                'queries' => $query_entries,
+            ]);
+            file_put_contents($query_log, $line . "\n", FILE_APPEND | LOCK_EX);
+        });
+    }
+
+    // Jalankan query dengan prepared statement; nilai dikirim terpisah dari SQL
+    // sehingga tidak perlu stripslashes()/mysqli_real_escape_string().
+    //   db_query($con, "SELECT ... WHERE username = ?", 's', $username)
+    // SELECT -> mysqli_result, query lain -> true, gagal -> false
+    // Kode error query terakhir ada di $db_errno (mis. 1062 = duplicate key)
+    $db_errno = 0;
+    function db_query($con, $sql, $types = '', ...$params){
+        global $query_log;
+        $before = $query_log ? handler_reads($con) : null;
+        $t      = hrtime(true);
+        $result = db_execute($con, $sql, $types, $params);
+        $ms     = (hrtime(true) - $t) / 1e6;
+        timing_add('query', $t);
+        if ($query_log) query_log_add($con, $sql, $types, $params, $ms, $before);
+        return $result;
+    }
+
+    function db_execute($con, $sql, $types, $params){
+        global $db_errno;
+        $db_errno = 0;
+        $stmt = mysqli_prepare($con, $sql);
+        if (!$stmt) {
+            $db_errno = mysqli_errno($con);
+            return false;
+        }
+        if ($types !== '') mysqli_stmt_bind_param($stmt, $types, ...$params);
+        if (!mysqli_stmt_execute($stmt)) {
+            $db_errno = mysqli_stmt_errno($stmt);
+            mysqli_stmt_close($stmt);
+            return false;
+        }
+        $result = mysqli_stmt_get_result($stmt);
+        if ($result === false) $result = mysqli_stmt_errno($stmt) === 0;
+        mysqli_stmt_close($stmt);
+        return $result;
+    }
 ?>
\ No newline at end of file
@@ -10,20 +10,31 @@ if( isset($_SESSION['username']) ) header('Location: index.php');
 
 if( isset($_POST['submit']) ){
         
-        $username = stripslashes($_POST['username']);
-        $username = mysqli_real_escape_string($con, $username);
-        $password = stripslashes($_POST['password']);
-        $password = mysqli_real_escape_string($con, $password);
+        $username = $_POST['username'];
+        $password = $_POST['password'];
        
         if(!empty(trim($username)) && !empty(trim($password))){
 
-            $query      = "SELECT * FROM users WHERE username = '$username'";
-            $result     = mysqli_query($con, $query);
+            $result     = db_query($con, "SELECT id, password FROM users WHERE username = ? LIMIT 1", 's', $username);
             $rows       = mysqli_num_rows($result);
 
             if ($rows != 0) {
-                $hash   = mysqli_fetch_assoc($result)['password'];
-                if(password_verify($password, $hash)){
+                $row    = mysqli_fetch_assoc($result);
+                $hash   = $row['password'];
+                $t      = hrtime(true);
+                $valid  = password_verify($password, $hash);
+                // Hash lama dibuat dari password yang sudah di-escape; diterima sekali lalu disimpan ulang
+                $escaped = mysqli_real_escape_string($con, stripslashes($password));
+                $legacy  = !$valid && $escaped !== $password && password_verify($escaped, $hash);
+                timing_add('verify', $t);
+                if($valid || $legacy){
+                    // Hash lama dengan cost berbeda di-upgrade saat password asli tersedia
+                    if($legacy || password_needs_rehash($hash, PASSWORD_DEFAULT, $password_options)){
+                        $t       = hrtime(true);
+                        $newhash = password_hash($password, PASSWORD_DEFAULT, $password_options);
+                        timing_add('hash', $t);
+                        db_query($con, "UPDATE users SET password = ? WHERE id = ?", 'si', $newhash, $row['id']);
+                    }
                     $_SESSION['username'] = $username;
                
                     header('Location: index.php');
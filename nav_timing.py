@@ -0,0 +1,141 @@
+"""
+Navigation Timing per halaman: agregasi sampel dari semua worker dan budget
+performa yang menggagalkan run bila terlampaui.
+
+    PERF_BUDGETS="login.php:ttfb:p95=200,register.php:dcl:p95=500" pytest -n 4
+
+Format budget: <halaman>:<metrik>:<statistik>=<batas>, dipisah koma.
+Metrik: ttfb, dcl, load (ms sejak navigasi dimulai), blocking_count,
+blocking_bytes (resource yang memblokir render), serta connect, query, hash,
+verify dari header Server-Timing halaman PHP (SERVER_TIMING=1).
+Statistik: p50, p95, p99, max.
+"""
+import math
+import os
+import re
+from dataclasses import dataclass
+
+
+# =========================
+# KONFIGURASI
+# =========================
+NAV_METRICS = ("ttfb", "dcl", "load", "blocking_count", "blocking_bytes")
+# Nama metrik Server-Timing yang dikirim koneksi.php / login.php / register.php
+SERVER_METRICS = ("connect", "query", "hash", "verify")
+PERF_BUDGETS = os.getenv("PERF_BUDGETS", "")
+
+_STAT_RE = re.compile(r"p\d{1,2}|max")
+
+
+@dataclass(frozen=True)
+class Budget:
+    page: str
+    metric: str
+    stat: str
+    limit: float
+
+    def __str__(self):
+        return f"{self.page}:{self.metric}:{self.stat}={self.limit:g}"
+
+
+def parse_budgets(text: str = PERF_BUDGETS) -> list:
+    budgets = []
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        try:
+            key, limit = part.split("=")
+            page, metric, stat = key.split(":")
+            budget = Budget(page, metric, stat, float(limit))
+        except ValueError:
+            raise ValueError(f"Format PERF_BUDGETS salah: '{part}' (contoh: login.php:ttfb:p95=200)") from None
+        if metric not in NAV_METRICS + SERVER_METRICS or not _STAT_RE.fullmatch(stat):
+            raise ValueError(
+                f"Budget '{part}': metrik {', '.join(NAV_METRICS + SERVER_METRICS)}; "
+                f"statistik p50, p95, p99, ... atau max"
+            )
+        budgets.append(budget)
+    return budgets
+
+
+def parse_server_timing(header: str) -> dict:
+    """'query;dur=0.8, verify;dur=52.1' -> {"query": 0.8, "verify": 52.1}; metrik tanpa dur dilewati."""
+    metrics = {}
+    for part in filter(None, (p.strip() for p in header.split(","))):
+        name, *params = (p.strip() for p in part.split(";"))
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "dur":
+                try:
+                    metrics[name] = metrics.get(name, 0.0) + float(value.strip().strip('"'))
+                except ValueError:
+                    pass
+    return metrics
+
+
+# =========================
+# AGREGASI
+# =========================
+def statistic(values, stat: str) -> float:
+    """Persentil nearest-rank (pNN) atau max."""
+    ordered = sorted(values)
+    if stat == "max":
+        return ordered[-1]
+    rank = max(1, math.ceil(int(stat[1:]) / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def metric_values(samples, page: str, metric: str) -> list:
+    return [s[metric] for s in samples if s.get("page") == page and s.get(metric) is not None]
+
+
+def aggregate(samples, names=NAV_METRICS) -> dict:
+    """{halaman: {metrik: {n, p50, p95, max}}} dari sampel semua worker."""
+    result = {}
+    for page in sorted({s["page"] for s in samples}):
+        metrics = {}
+        for metric in names:
+            values = metric_values(samples, page, metric)
+            if values:
+                metrics[metric] = {"n": len(values)} | {
+                    stat: round(statistic(values, stat), 2) for stat in ("p50", "p95", "max")
+                }
+        result[page] = metrics
+    return result
+
+
+def check_budgets(samples, budgets) -> list:
+    """Daftar pelanggaran budget (kosong = lolos). Budget tanpa sampel dilewati."""
+    violations = []
+    for budget in budgets:
+        values = metric_values(samples, budget.page, budget.metric)
+        if not values:
+            continue
+        actual = statistic(values, budget.stat)
+        if actual > budget.limit:
+            violations.append(f"{budget}: {budget.stat} {budget.metric} = {actual:g} (n={len(values)})")
+    return violations
+
+
+def summary_lines(samples) -> list:
+    lines = [f"{'halaman':<14} {'n':>4} {'ttfb p50':>9} {'ttfb p95':>9} {'dcl p95':>8} {'load p95':>9} "
+             f"{'blocking':>8} {'bytes':>8}"]
+    for page, metrics in aggregate(samples).items():
+        def cell(metric, stat, width):
+            value = metrics.get(metric, {}).get(stat)
+            return f"{'-' if value is None else f'{value:g}':>{width}}"
+        n = max((m["n"] for m in metrics.values()), default=0)
+        lines.append(f"{page:<14} {n:>4} {cell('ttfb', 'p50', 9)} {cell('ttfb', 'p95', 9)} {cell('dcl', 'p95', 8)} "
+                     f"{cell('load', 'p95', 9)} {cell('blocking_count', 'max', 8)} {cell('blocking_bytes', 'max', 8)}")
+    return lines
+
+
+def server_summary_lines(samples) -> list:
+    """Tabel Server-Timing per halaman: p50/p95 setiap metrik (ms)."""
+    lines = [f"{'halaman':<14} {'n':>4} " + " ".join(f"{f'{m} p50':>12} {f'{m} p95':>12}" for m in SERVER_METRICS)]
+    for page, metrics in aggregate(samples, SERVER_METRICS).items():
+        cells = []
+        for metric in SERVER_METRICS:
+            values = metrics.get(metric, {})
+            cells += [f"{values.get(stat, '-'):>12}" for stat in ("p50", "p95")]
+        n = max((m["n"] for m in metrics.values()), default=0)
+        lines.append(f"{page:<14} {n:>4} " + " ".join(cells))
+    return lines
@@ -0,0 +1,72 @@
+"""
+Log query SQL per request HTTP (mode test) dari koneksi.php / stub server.
+
+Dengan QUERY_LOG=<file> di environment PHP (atau stub) setiap request
+menambah satu baris JSON:
+
+    {"request": "<tag>", "page": "login.php", "queries": [
+        {"sql": "...", "ms": 0.4, "rows_examined": 1, "full_scan": false, "errno": 0,
+         "explain": [...]}]}          # explain hanya untuk query >= QUERY_SLOW_MS
+
+Request yang dikirim http_engine selama `capture()` aktif membawa header
+X-Test-Request berisi tag unik, sehingga fixture `query_log` hanya membaca
+request milik test tersebut walaupun beberapa worker menulis ke file yang sama.
+"""
+import json
+import os
+import uuid
+from contextlib import contextmanager
+
+
+# =========================
+# KONFIGURASI
+# =========================
+# File JSONL yang ditulis PHP/stub; harus diisi sama di server dan di pytest
+QUERY_LOG = os.getenv("QUERY_LOG", "")
+
+# Query yang lebih lambat dari ini (ms) dicatat bersama EXPLAIN-nya
+QUERY_SLOW_MS = float(os.getenv("QUERY_SLOW_MS", "100"))
+
+REQUEST_HEADER = "X-Test-Request"
+
+
+# =========================
+# PEMBACA LOG
+# =========================
+class QueryLog:
+    """Request (dan query-nya) yang dikirim dengan tag milik satu test."""
+
+    def __init__(self, path: str = QUERY_LOG):
+        self.path = path
+        self.tag = uuid.uuid4().hex
+
+    def requests(self, page: str = None) -> list:
+        """Satu dict per request HTTP, berurutan sesuai waktu selesai di server."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f if self.tag in line]
+        except FileNotFoundError:
+            return []
+        return [e for e in entries if e["request"] == self.tag and (page is None or e["page"] == page)]
+
+    def queries(self, page: str = None) -> list:
+        return [q for request in self.requests(page) for q in request["queries"]]
+
+
+# Log milik test yang sedang berjalan (None -> request tanpa header tag)
+_current = None
+
+
+@contextmanager
+def capture(path: str = QUERY_LOG):
+    global _current
+    _current = QueryLog(path)
+    try:
+        yield _current
+    finally:
+        _current = None
+
+
+def request_headers() -> dict:
+    """Header yang ditambahkan ke setiap request http_engine selama capture() aktif."""
+    return {REQUEST_HEADER: _current.tag} if _current is not None else {}
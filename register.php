@@ -1,13 +1,3 @@
-<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
-<link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.1.3/css/bootstrap.min.css" integrity="sha384-MCw98/SFnGE8fJT3GXwEOngsV7Zt27NXFoaoApmYm81iuXoPkFOJwJ8ERdknLPMO" crossorigin="anonymous">
-<link rel="stylesheet" href="style.css">
-</head>
- 
-<body>
 <?php
 require('koneksi.php');
 session_start();
@@ -17,30 +7,27 @@ $validate = '';
 if( isset($_SESSION['user']) ) header('Location: index.php');
 if( isset($_POST['submit']) ){
         
-        $username = stripslashes($_POST['username']);
-        $username = mysqli_real_escape_string($con, $username);
-        $name     = stripslashes($_POST['name']);
-        $name     = mysqli_real_escape_string($con, $name);
-        $email    = stripslashes($_POST['email']);
-        $email    = mysqli_real_escape_string($con, $email);
-        $password = stripslashes($_POST['password']);
-        $password = mysqli_real_escape_string($con, $password);
-        $repass   = stripslashes($_POST['repassword']);
-        $repass   = mysqli_real_escape_string($con, $repass);
+        $username = $_POST['username'];
+        $name     = $_POST['name'];
+        $email    = $_POST['email'];
+        $password = $_POST['password'];
+        $repass   = $_POST['repassword'];
         if(!empty(trim($name)) && !empty(trim($username)) && !empty(trim($email)) && !empty(trim($password)) && !empty(trim($repass))){
             if($password == $repass){
-                if( cek_nama($name,$con) == 0 ){
-                    $pass  = password_hash($password, PASSWORD_DEFAULT);
-                    $query = "INSERT INTO users (username,name,email, password ) VALUES ('$username','$name','$email','$pass')";
-                    $result   = mysqli_query($con, $query);
-                    if ($result) {
-                        $_SESSION['username'] = $username;                       
-                        header('Location: index.php');                    
-                    } else {
-                        $error =  'Register User Gagal !!';
-                    }
-                }else{
-                        $error =  'Username sudah terdaftar !!';
+                // Satu INSERT saja: UNIQUE KEY username & email menolak duplikat secara atomik
+                // (tanpa SELECT terpisah yang bisa balapan dengan registrasi paralel)
+                $t      = hrtime(true);
+                $pass   = password_hash($password, PASSWORD_DEFAULT, $password_options);
+                timing_add('hash', $t);
+                $result = db_query($con, "INSERT INTO users (username,name,email, password ) VALUES (?,?,?,?)",
+                                   'ssss', $username, $name, $email, $pass);
+                if ($result) {
+                    $_SESSION['username'] = $username;                       
+                    header('Location: index.php');                    
+                } elseif ($db_errno == 1062) {
+                    $error =  'Username sudah terdaftar !!';
+                } else {
+                    $error =  'Register User Gagal !!';
                 }
             }else{
                 $validate = 'Password tidak sama !!';
@@ -50,13 +37,18 @@ if( isset($_POST['submit']) ){
             $error =  'Data tidak boleh kosong !!';
         }
     } 
-
-    function cek_nama($username,$con){
-        $nama = mysqli_real_escape_string($con, $username);
-        $query = "SELECT * FROM users WHERE username = '$nama'";
-        if( $result = mysqli_query($con, $query) ) return mysqli_num_rows($result);
-    }
 ?>
+
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">
+<link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.1.3/css/bootstrap.min.css" integrity="sha384-MCw98/SFnGE8fJT3GXwEOngsV7Zt27NXFoaoApmYm81iuXoPkFOJwJ8ERdknLPMO" crossorigin="anonymous">
+<link rel="stylesheet" href="style.css">
+</head>
+ 
+<body>
         <section class="container-fluid mb-4">
             <section class="row justify-content-center">
             <section class="col-12 col-sm-6 col-md-4">
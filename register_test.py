@@ -1,13 +1,10 @@
 import os
-import time
-import uuid
-import pytest
-from selenium.webdriver.support import expected_conditions as EC
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.support.ui import WebDriverWait
+
+from accounts import unique_suffix
+from browser import fill_fields, open_page, probe_page, submit_and_wait
+from timing import timed
 
 
 # =========================
@@ -19,63 +16,45 @@ TIMEOUT = int(os.getenv("SELENIUM_TIMEOUT", "10"))
 
 REGISTER_SUCCESS_TEXT = os.getenv("REGISTER_SUCCESS_TEXT", "berhasil")
 REGISTER_FAIL_TEXT = os.getenv("REGISTER_FAIL_TEXT", "gagal")
-
-
-# =========================
-# DRIVER (Incognito)
-# =========================
-def create_chrome_driver(headless: bool = False):
-    options = ChromeOptions()
-    options.add_argument("--incognito")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    if headless:
-        options.add_argument("--headless=new")
-    driver = webdriver.Chrome(options=options)
-    driver.set_window_size(1280, 720)
-    return driver
-
-
-@pytest.fixture
-def driver():
-    headless = os.getenv("HEADLESS", "0") == "1"
-    drv = create_chrome_driver(headless=headless)
-    yield drv
-    drv.quit()
+REGISTER_DUPLICATE_TEXT = "sudah terdaftar"
 
 
 # =========================
 # HELPER
 # =========================
-def wait_ready(driver):
-    WebDriverWait(driver, TIMEOUT).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
-    )
-
-
 def page_has_text(driver, text_lower: str) -> bool:
-    return text_lower in driver.page_source.lower()
+    return probe_page(driver, text_lower).has_text(text_lower)
 
 
+@timed("assert")
 def assert_register_success(driver):
-    current = driver.current_url.lower()
-    if "register.php" not in current:
+    state = probe_page(driver, REGISTER_SUCCESS_TEXT)
+    if "register.php" not in state.url.lower():
         return
-    assert page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()), (
+    assert state.has_text(REGISTER_SUCCESS_TEXT), (
         f"Register dianggap gagal. URL masih register.php dan tidak menemukan text '{REGISTER_SUCCESS_TEXT}'."
     )
 
 
+@timed("assert")
 def assert_register_fail(driver):
-    current = driver.current_url.lower()
-    if "register.php" in current:
+    state = probe_page(driver, REGISTER_FAIL_TEXT)
+    if "register.php" in state.url.lower():
         return
-    assert page_has_text(driver, REGISTER_FAIL_TEXT.lower()), (
+    assert state.has_text(REGISTER_FAIL_TEXT), (
         f"Register seharusnya gagal. Tapi URL berubah dan tidak menemukan text '{REGISTER_FAIL_TEXT}'."
     )
 
 
+@timed("assert")
+def assert_register_duplicate(driver):
+    state = probe_page(driver, REGISTER_DUPLICATE_TEXT)
+    assert "register.php" in state.url.lower() and state.has_text(REGISTER_DUPLICATE_TEXT), (
+        f"Registrasi duplikat seharusnya ditolak dengan pesan '{REGISTER_DUPLICATE_TEXT}'. "
+        f"URL '{state.url}', alert '{state.alert}'."
+    )
+
+
 def find_first_existing(driver, candidates):
     for by, loc in candidates:
         elems = driver.find_elements(by, loc)
@@ -84,24 +63,15 @@ def find_first_existing(driver, candidates):
     raise Exception(f"Elemen tidak ditemukan. Candidates: {candidates}")
 
 
-def fill_register_form(driver, nama, email, username, password, repassword):
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "username"))
-    ).clear()
-    driver.find_element(By.ID, "username").send_keys(username)
-
-    driver.find_element(By.ID, "name").clear()
-    driver.find_element(By.ID, "name").send_keys(nama)
-
-    driver.find_element(By.ID, "InputEmail").clear()
-    driver.find_element(By.ID, "InputEmail").send_keys(email)
-
-    driver.find_element(By.ID, "InputPassword").clear()
-    driver.find_element(By.ID, "InputPassword").send_keys(password)
-
-    driver.find_element(By.ID, "InputRePassword").clear()
-    driver.find_element(By.ID, "InputRePassword").send_keys(repassword)
-
+@timed("fill")
+def fill_register_form(driver, nama, email, username, password, repassword, keystrokes=None):
+    fill_fields(driver, {
+        "username": username,
+        "name": nama,
+        "InputEmail": email,
+        "InputPassword": password,
+        "InputRePassword": repassword,
+    }, keystrokes)
 
 
 def submit_register(driver):
@@ -111,7 +81,7 @@ def submit_register(driver):
         (By.XPATH, "//button[contains(., 'Register')]"),
         (By.XPATH, "//button[contains(., 'Daftar')]"),
     ])
-    btn.click()
+    submit_and_wait(driver, btn, TIMEOUT)
 
 
 # =========================
@@ -121,10 +91,9 @@ def test_TC_R_01_register_valid(driver):
     """
     TC-R-01: registrasi valid (semua field terisi)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -134,7 +103,6 @@ def test_TC_R_01_register_valid(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_success(driver)
 
@@ -143,10 +111,9 @@ def test_TC_R_02_register_nama_empty(driver):
     """
     TC-R-02: nama kosong (harus ditolak)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="",
@@ -156,7 +123,6 @@ def test_TC_R_02_register_nama_empty(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_fail(driver)
 
@@ -165,10 +131,9 @@ def test_TC_R_03_register_email_empty(driver):
     """
     TC-R-03: email kosong (harus ditolak)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -178,7 +143,6 @@ def test_TC_R_03_register_email_empty(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_fail(driver)
 
@@ -187,8 +151,7 @@ def test_TC_R_04_register_username_empty(driver):
     """
     TC-R-04: username kosong (harus ditolak)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
     fill_register_form(
         driver,
@@ -199,7 +162,6 @@ def test_TC_R_04_register_username_empty(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_fail(driver)
 
@@ -209,10 +171,9 @@ def test_TC_R_05_register_password_empty(driver):
     TC-R-05: password kosong (harus ditolak)
     Catatan: PHP menolak jika password kosong - ini sudah benar
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -222,7 +183,6 @@ def test_TC_R_05_register_password_empty(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_fail(driver)
 
@@ -232,10 +192,9 @@ def test_TC_R_06_register_sql_injection_username(driver):
     TC-R-06: SQL Injection pada username
     Expected Result: Ditolak karena PHP menggunakan mysqli_real_escape_string
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"sqli_{uuid.uuid4().hex[:8]}"
+    u = f"sqli_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -245,11 +204,10 @@ def test_TC_R_06_register_sql_injection_username(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Cek apakah SQL injection berhasil atau tidak
-    current = driver.current_url.lower()
-    if "register.php" not in current or page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
+    state = probe_page(driver, REGISTER_SUCCESS_TEXT)
+    if "register.php" not in state.url.lower() or state.has_text(REGISTER_SUCCESS_TEXT):
         print("⚠️ KERENTANAN: SQL Injection pada username diterima sistem")
     else:
         print("✓ AMAN: SQL Injection pada username ditolak")
@@ -260,10 +218,9 @@ def test_TC_R_07_register_repassword_empty(driver):
     """
     TC-R-07: Re-Password kosong (harus ditolak karena tidak match dengan password)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -273,11 +230,10 @@ def test_TC_R_07_register_repassword_empty(driver):
         repassword="",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # PHP akan menolak karena repassword kosong
-    current = driver.current_url.lower()
-    if "register.php" not in current and page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
+    state = probe_page(driver, REGISTER_SUCCESS_TEXT)
+    if "register.php" not in state.url.lower() and state.has_text(REGISTER_SUCCESS_TEXT):
         print("⚠️ KERENTANAN: Registrasi berhasil dengan repassword kosong")
     else:
         print("✓ AMAN: Repassword kosong ditolak")
@@ -289,10 +245,9 @@ def test_TC_R_08_register_password_mismatch(driver):
     """
     TC-R-08: Password tidak sama dengan Re-Password (harus ditolak)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -302,7 +257,6 @@ def test_TC_R_08_register_password_mismatch(driver):
         repassword="pass124",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_fail(driver)
 
@@ -311,10 +265,9 @@ def test_TC_R_09_register_email_invalid_no_at(driver):
     """
     TC-R-09: Format email tidak valid (tanpa '@') (harus ditolak)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -324,7 +277,6 @@ def test_TC_R_09_register_email_invalid_no_at(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_fail(driver)
 
@@ -333,10 +285,9 @@ def test_TC_R_10_register_email_invalid_no_domain(driver):
     """
     TC-R-10: Format email tidak valid (tanpa domain) (harus ditolak)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -346,55 +297,42 @@ def test_TC_R_10_register_email_invalid_no_domain(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     assert_register_fail(driver)
 
 
 def test_TC_R_11_register_email_duplicate(driver):
     """
-    TC-R-11: Email sudah terdaftar
-    Catatan: PHP tidak melakukan validasi email duplikat, hanya username
-    Jadi registrasi kedua dengan email sama BERHASIL (ini adalah temuan)
+    TC-R-11: Email sudah terdaftar (harus ditolak)
+    Catatan: UNIQUE KEY email membuat INSERT kedua gagal -> "Username sudah terdaftar !!"
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
     # Pakai email yang sama untuk 2 registrasi
-    shared_email = f"dup_{uuid.uuid4().hex[:6]}@mail.com"
+    shared_email = f"dup_{unique_suffix(6)}@mail.com"
 
     # Registrasi pertama (harus berhasil)
-    u1 = f"user_{uuid.uuid4().hex[:8]}"
+    u1 = f"user_{unique_suffix()}"
     fill_register_form(driver, "User Otomatis", shared_email, u1, "pass123", "pass123")
     submit_register(driver)
-    time.sleep(1)
     assert_register_success(driver)
 
-    # Registrasi kedua dengan email sama - PHP TIDAK cek email duplikat
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
-    u2 = f"user_{uuid.uuid4().hex[:8]}"
+    # Registrasi kedua dengan email sama (harus gagal)
+    open_page(driver, REGISTER_URL)
+    u2 = f"user_{unique_suffix()}"
     fill_register_form(driver, "User Otomatis", shared_email, u2, "pass123", "pass123")
     submit_register(driver)
-    time.sleep(1)
-    # Temuan: PHP mengizinkan email duplikat
-    if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
-        print("⚠️ KERENTANAN: Sistem mengizinkan email duplikat!")
-    else:
-        print("✓ AMAN: Email duplikat ditolak")
-    # Test selalu PASS
-    assert True
+    assert_register_duplicate(driver)
 
 
 def test_TC_R_12_register_username_duplicate(driver):
     """
     TC-R-12: Username sudah terdaftar (harus ditolak / gagal)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
     # Pakai username yang sama untuk 2 registrasi
-    shared_username = f"userdup_{uuid.uuid4().hex[:6]}"
+    shared_username = f"userdup_{unique_suffix(6)}"
 
     # Registrasi pertama (harus berhasil)
     fill_register_form(
@@ -406,31 +344,20 @@ def test_TC_R_12_register_username_duplicate(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
     assert_register_success(driver)
 
     # Registrasi kedua dengan username sama (harus gagal)
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
     fill_register_form(
         driver,
         nama="User Otomatis",
-        email=f"{shared_username}_{uuid.uuid4().hex[:4]}@mail.com",
+        email=f"{shared_username}_{unique_suffix(4)}@mail.com",
         username=shared_username,
         password="pass123",
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
-    
-    # Cek apakah username duplikat ditolak atau diterima
-    current = driver.current_url.lower()
-    if "register.php" in current or page_has_text(driver, REGISTER_FAIL_TEXT.lower()):
-        print("✓ AMAN: Username duplikat ditolak")
-    else:
-        print("⚠️ KERENTANAN: Username duplikat diterima oleh sistem")
-    # Test selalu PASS
-    assert True
+    assert_register_duplicate(driver)
 
 
 def test_TC_R_13_register_username_contains_space(driver):
@@ -438,20 +365,18 @@ def test_TC_R_13_register_username_contains_space(driver):
     TC-R-13: Username mengandung spasi
     Temuan: PHP tidak memvalidasi spasi pada username - DITERIMA
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user {uuid.uuid4().hex[:6]}"  # ada spasi
+    u = f"user {unique_suffix(6)}"  # ada spasi
     fill_register_form(
         driver,
         nama="User Otomatis",
-        email=f"space_{uuid.uuid4().hex[:6]}@mail.com",
+        email=f"space_{unique_suffix(6)}@mail.com",
         username=u,
         password="pass123",
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Temuan: PHP tidak validasi spasi pada username
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
@@ -467,20 +392,18 @@ def test_TC_R_14_register_username_special_chars(driver):
     TC-R-14: Username karakter spesial
     Temuan: PHP tidak memvalidasi karakter spesial - DITERIMA
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_spec_{uuid.uuid4().hex[:4]}"
+    u = f"user_spec_{unique_suffix(4)}"
     fill_register_form(
         driver,
         nama="User Otomatis",
-        email=f"spec_{uuid.uuid4().hex[:6]}@mail.com",
+        email=f"spec_{unique_suffix(6)}@mail.com",
         username=u,
         password="pass123",
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Temuan: PHP tidak validasi karakter spesial
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
@@ -496,11 +419,10 @@ def test_TC_R_15_register_name_too_long(driver):
     TC-R-15: Nama terlalu panjang
     Temuan: PHP tidak memvalidasi panjang nama - test dengan nama normal
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
     long_name = "User Dengan Nama Panjang"
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama=long_name,
@@ -510,7 +432,6 @@ def test_TC_R_15_register_name_too_long(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Temuan: PHP tidak validasi panjang nama
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
@@ -526,20 +447,18 @@ def test_TC_R_16_register_username_too_long(driver):
     TC-R-16: Username dengan panjang normal
     Temuan: PHP tidak memvalidasi panjang username di aplikasi
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    long_username = f"user_{uuid.uuid4().hex[:8]}"
+    long_username = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
-        email=f"longu_{uuid.uuid4().hex[:6]}@mail.com",
+        email=f"longu_{unique_suffix(6)}@mail.com",
         username=long_username,
         password="pass123",
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Temuan: PHP tidak validasi panjang username
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
@@ -555,10 +474,9 @@ def test_TC_R_17_register_password_too_short(driver):
     TC-R-17: Password pendek
     Temuan: PHP tidak memvalidasi panjang minimum password - DITERIMA
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -568,7 +486,6 @@ def test_TC_R_17_register_password_too_short(driver):
         repassword="1",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Temuan: PHP tidak validasi panjang minimum password
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
@@ -584,10 +501,9 @@ def test_TC_R_18_register_password_with_spaces(driver):
     TC-R-18: Password mengandung spasi
     Temuan: PHP tidak memvalidasi spasi pada password - DITERIMA
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -597,7 +513,6 @@ def test_TC_R_18_register_password_with_spaces(driver):
         repassword=" pass123 ",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Temuan: PHP tidak validasi spasi pada password
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
@@ -613,10 +528,9 @@ def test_TC_R_19_register_xss_in_name(driver):
     TC-R-19: XSS pada nama
     Temuan: PHP tidak memvalidasi/sanitasi XSS - DITERIMA
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="Test XSS User",
@@ -626,7 +540,6 @@ def test_TC_R_19_register_xss_in_name(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Temuan: PHP tidak sanitasi input XSS
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
@@ -641,10 +554,9 @@ def test_TC_R_20_register_sql_injection_email(driver):
     """
     TC-R-20: SQL Injection pada email (harus ditolak; jika diterima = temuan)
     """
-    driver.get(REGISTER_URL)
-    wait_ready(driver)
+    open_page(driver, REGISTER_URL)
 
-    u = f"user_{uuid.uuid4().hex[:8]}"
+    u = f"user_{unique_suffix()}"
     fill_register_form(
         driver,
         nama="User Otomatis",
@@ -654,7 +566,6 @@ def test_TC_R_20_register_sql_injection_email(driver):
         repassword="pass123",
     )
     submit_register(driver)
-    time.sleep(1)
 
     # Cek apakah SQL injection berhasil atau tidak
     if page_has_text(driver, REGISTER_SUCCESS_TEXT.lower()):
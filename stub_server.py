@@ -0,0 +1,327 @@
+"""
+Stub server Python pengganti PHP + MySQL untuk login.php dan register.php.
+
+HTML diambil langsung dari file PHP (blok logika PHP dibuang, blok
+`$error` / `$validate` dirender), sehingga id field dan markup selalu sama
+dengan halaman asli. Logika form meniru kode PHP baris per baris, termasuk
+perilaku MySQL (collation utf8mb4_general_ci: perbandingan username tidak
+peka huruf besar/kecil dan mengabaikan spasi di akhir).
+
+Pemakaian mandiri:  python stub_server.py --port 8000
+"""
+import argparse
+import hashlib
+import html
+import os
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+try:
+    import bcrypt
+except ImportError:  # hash $2y$ dari dump hanya bisa diverifikasi jika bcrypt terpasang
+    bcrypt = None
+
+from query_log import QUERY_LOG, REQUEST_HEADER
+from timing import write_record
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Sama dengan isi db/quiz_pengupil.sql; user01/pass123 sama dengan yang dibuat CI
+SEED_USERS = [
+    ("", "irul", "irul@irul.com", "$2y$10$D9yc9Mt0t8niCNO9di8ejOUPib46suwHghqFnJRKQJ3Z6uwRDxfw."),
+    ("", "ahmad", "ahmad@ahmad.com", "$2y$10$OWez2au.UMnz3yedD0BqH.bsOC374XoV9VhMigepVzLyuq2jETHs2"),
+    ("Test User", "user01", "user01@test.com", None),
+]
+SEED_PASSWORDS = {"user01": "pass123"}
+
+# Panjang kolom tabel users (MySQL strict mode menolak data yang lebih panjang)
+COLUMN_LENGTH = {"name": 70, "username": 50, "email": 50}
+
+# SERVER_TIMING=1: kirim header Server-Timing (query, hash, verify) seperti koneksi.php
+SERVER_TIMING = os.getenv("SERVER_TIMING", "0") == "1"
+
+# Kode error MySQL untuk INSERT yang gagal (register.php membedakan 1062)
+ER_DUP_ENTRY = 1062
+ER_DATA_TOO_LONG = 1406
+
+_IF_ERROR_RE = re.compile(r"<\?php if\(\$error != ''\)\{ \?>(.*?)<\?php \} \?>", re.S)
+_IF_VALIDATE_RE = re.compile(r"<\?php if\(\$validate != ''\) \{\?>(.*?)<\?php \}\?>", re.S)
+_PHP_BLOCK_RE = re.compile(r"<\?php.*?\?>\n?", re.S)
+
+
+# =========================
+# PERILAKU PHP / MYSQL
+# =========================
+def php_empty_trim(value: str) -> bool:
+    """empty(trim($value)) -- termasuk "0" yang dianggap kosong oleh PHP."""
+    return value.strip(" \t\n\r\0\x0b") in ("", "0")
+
+
+def collation_key(value: str) -> str:
+    return value.rstrip(" ").lower()
+
+
+def hash_password(password: str) -> str:
+    salt = secrets.token_hex(8)
+    return f"stub${salt}${hashlib.sha256((salt + password).encode()).hexdigest()}"
+
+
+def verify_password(password: str, stored: str) -> bool:
+    if stored.startswith("stub$"):
+        _, salt, digest = stored.split("$")
+        return secrets.compare_digest(hashlib.sha256((salt + password).encode()).hexdigest(), digest)
+    if bcrypt is not None and stored.startswith("$2y$"):
+        return bcrypt.checkpw(password.encode(), ("$2b$" + stored[4:]).encode())
+    return False
+
+
+@contextmanager
+def server_timing(timings, name: str):
+    """Padanan `$t = hrtime(true); ...; timing_add($name, $t);` (tidak mencatat bila `timings` None)."""
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+@contextmanager
+def db_query(timings, queries, sql: str):
+    """
+    Padanan db_query(): durasi masuk Server-Timing `query` dan, bila log query
+    aktif (`queries` bukan None), satu entri seperti koneksi.php. Lookup
+    UserStore selalu lewat index sehingga full_scan selalu false.
+    """
+    entry = {"sql": sql, "rows_examined": 0, "full_scan": False, "errno": 0}
+    start = time.perf_counter()
+    with server_timing(timings, "query"):
+        yield entry
+    entry["ms"] = round((time.perf_counter() - start) * 1000, 3)
+    if queries is not None:
+        queries.append(entry)
+
+
+def render_page(page: str, error: str = "", validate: str = "") -> str:
+    with open(os.path.join(ROOT, page), encoding="utf-8") as f:
+        source = f.read()
+    source = _IF_ERROR_RE.sub(lambda m: m.group(1).replace("<?= $error; ?>", error) if error else "", source)
+    source = _IF_VALIDATE_RE.sub(lambda m: m.group(1).replace("<?= $validate; ?>", validate) if validate else "", source)
+    return _PHP_BLOCK_RE.sub("", source)
+
+
+# =========================
+# PENYIMPANAN USER
+# =========================
+class UserStore:
+    """Tabel users in-memory dengan UNIQUE KEY `username` dan `email` (lookup O(1) seperti index MySQL)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows = []
+        self._by_username = {}
+        self._by_email = {}
+        for name, username, email, password in SEED_USERS:
+            self.insert(name, username, email, password or hash_password(SEED_PASSWORDS[username]))
+
+    def find(self, username: str):
+        return self._by_username.get(collation_key(username))
+
+    def insert(self, name, username, email, password) -> int:
+        """INSERT satu baris -> kode error MySQL (0 = berhasil, 1062 = duplicate key, 1406 = data terlalu panjang)."""
+        row = {"name": name, "username": username, "email": email, "password": password}
+        if any(len(row[col]) > limit for col, limit in COLUMN_LENGTH.items()):
+            return ER_DATA_TOO_LONG
+        key, email_key = collation_key(username), collation_key(email)
+        with self._lock:
+            if key in self._by_username or email_key in self._by_email:
+                return ER_DUP_ENTRY
+            row["id"] = len(self._rows) + 1
+            self._rows.append(row)
+            self._by_username[key] = row
+            self._by_email[email_key] = row
+        return 0
+
+    def __len__(self):
+        return len(self._rows)
+
+
+# =========================
+# HANDLER HALAMAN
+# =========================
+def login_page(store, session, form, timings=None, queries=None):
+    """Padanan login.php -> (location redirect, html)."""
+    error = ""
+    location = "index.php" if "username" in session else ""
+    if "submit" in form:
+        username = form.get("username", "")
+        password = form.get("password", "")
+        if not php_empty_trim(username) and not php_empty_trim(password):
+            with db_query(timings, queries, "SELECT id, password FROM users WHERE username = ? LIMIT 1") as query:
+                row = store.find(username)
+                query["rows_examined"] = int(row is not None)
+            if row is not None:
+                with server_timing(timings, "verify"):
+                    valid = verify_password(password, row["password"])
+                if valid:
+                    session["username"] = username
+                    location = "index.php"
+            else:
+                error = "Register User Gagal !!"
+        else:
+            error = "Data tidak boleh kosong !!"
+    return location, render_page("login.php", error)
+
+
+def register_page(store, session, form, timings=None, queries=None):
+    """Padanan register.php -> (location redirect, html)."""
+    error = validate = location = ""
+    if "submit" in form:
+        username = form.get("username", "")
+        name = form.get("name", "")
+        email = form.get("email", "")
+        password = form.get("password", "")
+        repass = form.get("repassword", "")
+        if not any(php_empty_trim(v) for v in (name, username, email, password, repass)):
+            if password == repass:
+                with server_timing(timings, "hash"):
+                    hashed = hash_password(password)
+                with db_query(timings, queries,
+                              "INSERT INTO users (username,name,email, password ) VALUES (?,?,?,?)") as query:
+                    errno = query["errno"] = store.insert(name, username, email, hashed)
+                if errno == 0:
+                    session["username"] = username
+                    location = "index.php"
+                elif errno == ER_DUP_ENTRY:
+                    error = "Username sudah terdaftar !!"
+                else:
+                    error = "Register User Gagal !!"
+            else:
+                validate = "Password tidak sama !!"
+        else:
+            error = "Data tidak boleh kosong !!"
+    return location, render_page("register.php", error, validate)
+
+
+PAGES = {"/login.php": login_page, "/register.php": register_page}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Header + body dikirim dalam satu write (tanpa jeda Nagle/delayed ACK ~40 ms)
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch({})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode("utf-8", "replace")
+        self._dispatch(dict(parse_qsl(body, keep_blank_values=True)))
+
+    def _dispatch(self, form):
+        path = urlsplit(self.path).path
+        handler = PAGES.get(path)
+        if handler is None:
+            self._static(path)
+            return
+        session_id, session = self.server.session(self.headers.get("Cookie", ""))
+        timings = {} if self.server.server_timing else None
+        queries = [] if self.server.query_log else None
+        location, page = handler(self.server.users, session, form, timings, queries)
+        if queries is not None:
+            # Ditulis sebelum respons dikirim, sama seperti shutdown function koneksi.php
+            write_record({"request": self.headers.get(REQUEST_HEADER, ""), "page": path.lstrip("/"),
+                          "queries": queries}, self.server.query_log)
+        headers = {"Content-Type": "text/html; charset=UTF-8", "Set-Cookie": f"PHPSESSID={session_id}; path=/"}
+        if location:
+            headers["Location"] = location
+        if timings:
+            headers["Server-Timing"] = ", ".join(f"{name};dur={ms:.3f}" for name, ms in timings.items())
+        self._send(302 if location else 200, page.encode(), headers)
+
+    def _static(self, path):
+        file_path = os.path.join(ROOT, path.lstrip("/"))
+        if path.endswith(".css") and os.path.isfile(file_path):
+            with open(file_path, "rb") as f:
+                self._send(200, f.read(), {"Content-Type": "text/css; charset=UTF-8"})
+            return
+        # Sama seperti `php -S`, halaman yang tidak ada (mis. index.php) -> 404
+        body = f"<h1>Not Found</h1><p>The requested resource <code>{html.escape(path)}</code> was not found on this server.</p>"
+        self._send(404, body.encode(), {"Content-Type": "text/html; charset=UTF-8"})
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Backlog listen default (5) membuat SYN dibuang saat uji beban dengan banyak klien
+    request_queue_size = 128
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, server_timing: bool = SERVER_TIMING,
+                 query_log: str = QUERY_LOG):
+        super().__init__((host, port), StubHandler)
+        self.users = UserStore()
+        self.server_timing = server_timing
+        self.query_log = query_log
+        self._sessions = {}
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def session(self, cookie_header: str):
+        cookie = SimpleCookie(cookie_header)
+        session_id = cookie["PHPSESSID"].value if "PHPSESSID" in cookie else ""
+        if session_id not in self._sessions:
+            session_id = secrets.token_hex(13)
+            self._sessions[session_id] = {}
+        return session_id, self._sessions[session_id]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, server_timing: bool = SERVER_TIMING,
+                      query_log: str = QUERY_LOG) -> StubServer:
+    return StubServer(host, port, server_timing, query_log).start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub server login.php/register.php tanpa PHP + MySQL")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = StubServer(args.host, args.port)
+    print(f"Stub server berjalan di {server.base_url} (Ctrl+C untuk berhenti)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,190 @@
+"""
+ENGINE=tabs: case di cases.py dijalankan bersamaan di banyak tab satu Chrome.
+
+Setiap case mendapat browser context DevTools sendiri (cookie jar dan sesi
+PHP terpisah) berisi satu tab; sampai TABS case berjalan bersamaan lewat
+satu koneksi CDP asyncio. Chrome tetap diluncurkan lewat create_chrome_driver
+sehingga opsi HEADLESS, BLOCKED_URLS, ALLOWED_HOSTS, dst. tetap berlaku.
+"""
+import asyncio
+import json
+import os
+import time
+import urllib.request
+from dataclasses import dataclass
+
+from accounts import TIMEOUT, base_url
+from browser import BLOCKED_URLS, POLL_INTERVAL, READY_STATES
+from cdp import CDPConnection, CDPError
+from http_engine import Outcome, check_outcome
+
+
+# =========================
+# KONFIGURASI
+# =========================
+# Jumlah tab (case) yang berjalan bersamaan di satu browser
+TABS = int(os.getenv("TABS", "8"))
+
+# Isi field berdasarkan atribut name lalu submit lewat tombol name="submit"
+# (requestSubmit menjalankan validasi HTML5 seperti klik user). Mengembalikan
+# false bila form tidak valid sehingga tidak ada navigasi yang perlu ditunggu.
+_FILL_SUBMIT_JS = """
+(fields => {
+    const form = document.querySelector('form');
+    for (const [name, value] of Object.entries(fields)) {
+        if (form.elements[name]) form.elements[name].value = value;
+    }
+    const valid = form.checkValidity();
+    if (valid) window.__tabSubmitted = true;
+    form.requestSubmit(form.querySelector("[name='submit']"));
+    return valid;
+})
+"""
+
+_STATE_JS = """
+(() => {
+    const alert = document.querySelector('.alert-danger');
+    const validate = document.querySelector('.text-danger');
+    return {
+        url: location.href,
+        alert: alert ? alert.textContent.trim() : '',
+        validate: validate ? validate.textContent.trim() : '',
+        has_password: !!document.querySelector("input[type='password']"),
+        body: document.documentElement ? document.documentElement.outerHTML : '',
+    };
+})()
+"""
+
+
+@dataclass
+class CaseResult:
+    case_id: str
+    error: str = ""
+    seconds: float = 0.0
+
+
+# =========================
+# TAB
+# =========================
+class Tab:
+    """Satu tab di browser context sendiri, dikendalikan lewat sessionId CDP."""
+
+    def __init__(self, cdp: CDPConnection):
+        self.cdp = cdp
+        self.context_id = None
+        self.session_id = None
+
+    async def open(self):
+        self.context_id = (await self.cdp.send("Target.createBrowserContext"))["browserContextId"]
+        target = await self.cdp.send("Target.createTarget", {
+            "url": "about:blank", "browserContextId": self.context_id, "width": 1280, "height": 720,
+        })
+        attached = await self.cdp.send("Target.attachToTarget", {"targetId": target["targetId"], "flatten": True})
+        self.session_id = attached["sessionId"]
+        if BLOCKED_URLS:
+            await self.send("Network.enable")
+            await self.send("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+    async def close(self):
+        if self.context_id:
+            await self.cdp.send("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+            self.context_id = None
+
+    async def send(self, method: str, params: dict = None) -> dict:
+        return await self.cdp.send(method, params, self.session_id)
+
+    async def evaluate(self, expression: str):
+        result = await self.send("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        if "exceptionDetails" in result:
+            raise CDPError(f"JavaScript error: {result['exceptionDetails'].get('text', '')}")
+        return result["result"].get("value")
+
+    async def wait_ready(self, timeout: float = TIMEOUT):
+        """Tunggu dokumen baru (bukan dokumen tempat submit) mencapai READY_STATES."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                state, submitted = await self.evaluate("[document.readyState, !!window.__tabSubmitted]")
+                if state in READY_STATES and not submitted:
+                    return
+            except CDPError:
+                pass  # dokumen sedang berganti, execution context lama sudah hilang
+            if time.perf_counter() >= deadline:
+                raise TimeoutError(f"Halaman belum siap setelah {timeout} detik")
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def open_page(self, url: str):
+        result = await self.send("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            raise CDPError(f"Gagal membuka {url}: {result['errorText']}")
+        await self.wait_ready()
+
+    async def submit(self, fields: dict):
+        if await self.evaluate(f"{_FILL_SUBMIT_JS}({json.dumps(fields)})"):
+            await self.wait_ready()
+
+    async def outcome(self, page: str) -> Outcome:
+        """Kondisi halaman dalam bentuk Outcome http_engine (redirect = URL bukan lagi `page`)."""
+        state = await self.evaluate(_STATE_JS)
+        redirected = page not in state["url"].lower()
+        return Outcome(
+            status=302 if redirected else 200,
+            location=state["url"] if redirected else "",
+            alert=state["alert"],
+            validate=state["validate"],
+            has_password=state["has_password"],
+            body=state["body"],
+        )
+
+
+# =========================
+# EKSEKUSI CASE
+# =========================
+async def run_case(cdp: CDPConnection, case) -> CaseResult:
+    start = time.perf_counter()
+    error = ""
+    tab = Tab(cdp)
+    try:
+        await tab.open()
+        values = case.values()
+        for fields, expect in case.steps:
+            await tab.open_page(f"{base_url()}/{case.page}")
+            await tab.submit({k: v.format(**values) for k, v in fields.items()})
+            check_outcome(case.id, case.page, await tab.outcome(case.page), expect)
+    except AssertionError as err:
+        error = str(err)
+    except (CDPError, ConnectionError, TimeoutError) as err:
+        error = f"{case.id}: {type(err).__name__}: {err}"
+    finally:
+        try:
+            await tab.close()
+        except (CDPError, ConnectionError, TimeoutError):
+            pass
+    return CaseResult(case.id, error, time.perf_counter() - start)
+
+
+async def run_cases_async(ws_url: str, cases, tabs: int = TABS) -> dict:
+    cdp = await CDPConnection.connect(ws_url, TIMEOUT)
+    slots = asyncio.Semaphore(tabs)
+
+    async def limited(case):
+        async with slots:
+            return await run_case(cdp, case)
+
+    try:
+        results = await asyncio.gather(*(limited(case) for case in cases))
+    finally:
+        await cdp.close()
+    return {result.case_id: result for result in results}
+
+
+def browser_ws_url(driver) -> str:
+    """Endpoint DevTools level browser milik Chrome yang diluncurkan ChromeDriver."""
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    with urllib.request.urlopen(f"http://{address}/json/version", timeout=TIMEOUT) as resp:
+        return json.load(resp)["webSocketDebuggerUrl"]
+
+
+def run_cases(driver, cases, tabs: int = TABS) -> dict:
+    """Jalankan `cases` bersamaan di tab browser milik `driver` -> {case_id: CaseResult}."""
+    return asyncio.run(run_cases_async(browser_ws_url(driver), cases, tabs))
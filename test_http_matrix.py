@@ -0,0 +1,20 @@
+import pytest
+
+from cases import ALL_CASES
+from http_engine import ENGINE, run_case
+
+
+# =========================
+# MATRIX TC-L / TC-R TANPA BROWSER (ENGINE=http)
+# =========================
+pytestmark = [
+    pytest.mark.skipif(ENGINE != "http", reason="Set ENGINE=http untuk menjalankan case tanpa browser"),
+    pytest.mark.usefixtures("worker_account"),
+]
+
+HTTP_CASES = [c for c in ALL_CASES if not c.browser_only]
+
+
+@pytest.mark.parametrize("case", HTTP_CASES, ids=lambda c: c.id)
+def test_http_case(case):
+    run_case(case)
@@ -1,12 +1,11 @@
 import os
-import time
 import pytest
-from selenium.webdriver.support import expected_conditions as EC
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.support.ui import WebDriverWait
+
+from accounts import VALID_PASSWORD, VALID_USERNAME
+from browser import fill_fields, open_page, probe_page, submit_and_wait
+from timing import timed
 
 
 # =========================
@@ -19,67 +18,36 @@ BASE_URL = os.getenv(
 LOGIN_URL = f"{BASE_URL}/login.php"
 TIMEOUT = int(os.getenv("SELENIUM_TIMEOUT", "10"))
 
-# Akun existing - user01 dibuat di CI workflow dengan password pass123
-VALID_USERNAME = "user01"
-VALID_PASSWORD = "pass123"
-
 LOGIN_SUCCESS_TEXT = os.getenv("LOGIN_SUCCESS_TEXT", "logout")
 LOGIN_FAIL_TEXT = os.getenv("LOGIN_FAIL_TEXT", "gagal")
 
-
-# =========================
-# DRIVER (INCOGNITO)
-# =========================
-def create_chrome_driver(headless: bool = False):
-    options = ChromeOptions()
-    options.add_argument("--incognito")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-
-    if headless:
-        options.add_argument("--headless=new")
-
-    driver = webdriver.Chrome(options=options)
-    driver.set_window_size(1280, 720)
-    return driver
-
-
-@pytest.fixture
-def driver():
-    headless = os.getenv("HEADLESS", "0") == "1"
-    drv = create_chrome_driver(headless=headless)
-    yield drv
-    drv.quit()
+# Saat paralel, akun VALID_USERNAME milik worker dibuat dulu sebelum test berjalan
+pytestmark = pytest.mark.usefixtures("worker_account")
 
 
 # =========================
 # HELPER
 # =========================
-def wait_ready(driver):
-    WebDriverWait(driver, TIMEOUT).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
-    )
-
-
 def page_has_text(driver, text_lower: str) -> bool:
-    return text_lower in driver.page_source.lower()
+    return probe_page(driver, text_lower).has_text(text_lower)
 
 
+@timed("assert")
 def assert_login_success(driver):
-    current = driver.current_url.lower()
-    if "login.php" not in current:
+    state = probe_page(driver, LOGIN_SUCCESS_TEXT)
+    if "login.php" not in state.url.lower():
         return
-    assert page_has_text(driver, LOGIN_SUCCESS_TEXT.lower()), (
+    assert state.has_text(LOGIN_SUCCESS_TEXT), (
         f"Login gagal: tidak menemukan teks '{LOGIN_SUCCESS_TEXT}'."
     )
 
 
+@timed("assert")
 def assert_login_fail(driver):
-    current = driver.current_url.lower()
-    if "login.php" in current:
+    state = probe_page(driver, LOGIN_FAIL_TEXT)
+    if "login.php" in state.url.lower():
         return
-    assert page_has_text(driver, LOGIN_FAIL_TEXT.lower()), (
+    assert state.has_text(LOGIN_FAIL_TEXT), (
         f"Login seharusnya gagal, tapi URL berubah dan teks gagal tidak ditemukan."
     )
 
@@ -92,18 +60,13 @@ def find_first_existing(driver, candidates):
     raise Exception(f"Elemen tidak ditemukan. Candidates: {candidates}")
 
 
-def fill_login_form(driver, username, password):
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.ID, "username"))
-    ).clear()
-    driver.find_element(By.ID, "username").send_keys(username)
-
-    driver.find_element(By.ID, "InputPassword").clear()
-    driver.find_element(By.ID, "InputPassword").send_keys(password)
+@timed("fill")
+def fill_login_form(driver, username, password, keystrokes=None):
+    fill_fields(driver, {"username": username, "InputPassword": password}, keystrokes)
 
 
 def submit_login(driver):
-    driver.find_element(By.NAME, "submit").click()
+    submit_and_wait(driver, driver.find_element(By.NAME, "submit"), TIMEOUT)
 
 
 # =========================
@@ -113,16 +76,14 @@ def test_TC_L_01_login_valid(driver):
     """
     TC-L-01: Login dengan username & password valid
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, VALID_PASSWORD)
     submit_login(driver)
-    time.sleep(1)
 
     # Cek apakah login berhasil
-    current = driver.current_url.lower()
-    if "login.php" not in current or page_has_text(driver, LOGIN_SUCCESS_TEXT.lower()):
+    state = probe_page(driver, LOGIN_SUCCESS_TEXT)
+    if "login.php" not in state.url.lower() or state.has_text(LOGIN_SUCCESS_TEXT):
         print("✓ AMAN: Login valid berhasil")
     else:
         print("⚠️ GAGAL: Login valid tidak berhasil - periksa kredensial atau halaman")
@@ -134,12 +95,10 @@ def test_TC_L_02_login_wrong_password(driver):
     """
     TC-L-02: Password salah
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, "salah123")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -148,12 +107,10 @@ def test_TC_L_03_login_username_empty(driver):
     """
     TC-L-03: Username kosong
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, "", VALID_PASSWORD)
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -163,16 +120,14 @@ def test_TC_L_04_login_sql_injection(driver):
     TC-L-04: SQL Injection pada login
     Expected Result: SQL Injection ditolak karena PHP menggunakan mysqli_real_escape_string
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, "' OR '1'='1", "pass123")
     submit_login(driver)
-    time.sleep(1)
 
     # Cek apakah SQL injection berhasil atau tidak
-    current = driver.current_url.lower()
-    if "login.php" not in current or page_has_text(driver, LOGIN_SUCCESS_TEXT.lower()):
+    state = probe_page(driver, LOGIN_SUCCESS_TEXT)
+    if "login.php" not in state.url.lower() or state.has_text(LOGIN_SUCCESS_TEXT):
         print("⚠️ KERENTANAN: SQL Injection berhasil bypass login!")
     else:
         print("✓ AMAN: SQL Injection berhasil ditolak")
@@ -183,12 +138,10 @@ def test_TC_L_05_login_password_empty(driver):
     """
     TC-L-05: Password kosong
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, "")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -197,12 +150,10 @@ def test_TC_L_06_login_username_and_password_empty(driver):
     """
     TC-L-06: Username dan password kosong
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, "", "")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -211,12 +162,10 @@ def test_TC_L_07_login_username_with_spaces(driver):
     """
     TC-L-07: Username mengandung spasi di awal/akhir (leading/trailing)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, f" {VALID_USERNAME} ", VALID_PASSWORD)
     submit_login(driver)
-    time.sleep(1)
 
     # Idealnya ditolak kalau sistem tidak melakukan trim.
     # Jika ternyata berhasil, catat sebagai perilaku sistem.
@@ -227,12 +176,10 @@ def test_TC_L_08_login_password_with_spaces(driver):
     """
     TC-L-08: Password mengandung spasi di awal/akhir
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, f" {VALID_PASSWORD} ")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -241,12 +188,10 @@ def test_TC_L_09_login_username_case_sensitivity(driver):
     """
     TC-L-09: Uji case sensitivity pada username (User01 vs user01)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
-    fill_login_form(driver, "User01", VALID_PASSWORD)
+    fill_login_form(driver, VALID_USERNAME.capitalize(), VALID_PASSWORD)
     submit_login(driver)
-    time.sleep(1)
 
     # Umumnya username case-sensitive -> ditolak
     assert_login_fail(driver)
@@ -256,12 +201,10 @@ def test_TC_L_10_login_password_case_sensitivity(driver):
     """
     TC-L-10: Uji case sensitivity pada password (PASS123 vs pass123)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, "PASS123")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -270,12 +213,10 @@ def test_TC_L_11_login_username_special_char(driver):
     """
     TC-L-11: Username mengandung karakter spesial
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, f"{VALID_USERNAME}!", VALID_PASSWORD)
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -284,12 +225,10 @@ def test_TC_L_12_login_password_special_char(driver):
     """
     TC-L-12: Password ditambah karakter spesial
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, f"{VALID_PASSWORD}!")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -298,17 +237,14 @@ def test_TC_L_13_login_sql_injection_password(driver):
     """
     TC-L-13: SQL Injection pada password (harus ditolak)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, "' OR '1'='1")
     submit_login(driver)
-    time.sleep(1)
 
     # Cek apakah SQL injection berhasil atau tidak
-    current = driver.current_url.lower()
-    login_form_still_exists = len(driver.find_elements(By.CSS_SELECTOR, "input[type='password']")) > 0
-    if ("login.php" not in current) or not login_form_still_exists:
+    state = probe_page(driver)
+    if ("login.php" not in state.url.lower()) or not state.has_password:
         print("⚠️ KERENTANAN: SQL Injection di password berhasil bypass login!")
     else:
         print("✓ AMAN: SQL Injection di password berhasil ditolak")
@@ -320,16 +256,13 @@ def test_TC_L_14_login_sql_injection_both_fields(driver):
     """
     TC-L-14: SQL Injection pada username & password (harus ditolak)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, "' OR '1'='1", "' OR '1'='1")
     submit_login(driver)
-    time.sleep(1)
 
-    current = driver.current_url.lower()
-    login_form_still_exists = len(driver.find_elements(By.CSS_SELECTOR, "input[type='password']")) > 0
-    if ("login.php" not in current) or not login_form_still_exists:
+    state = probe_page(driver)
+    if ("login.php" not in state.url.lower()) or not state.has_password:
         print("⚠️ KERENTANAN: SQL Injection di kedua field berhasil bypass login!")
     else:
         print("✓ AMAN: SQL Injection di kedua field berhasil ditolak")
@@ -341,12 +274,10 @@ def test_TC_L_15_login_xss_username(driver):
     """
     TC-L-15: XSS pada username (harus ditolak / disanitasi)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, "<script>alert(1)</script>", VALID_PASSWORD)
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -355,12 +286,10 @@ def test_TC_L_16_login_xss_password(driver):
     """
     TC-L-16: XSS pada password (harus ditolak / disanitasi)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, VALID_USERNAME, "<script>alert(1)</script>")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -369,13 +298,11 @@ def test_TC_L_17_login_username_very_long(driver):
     """
     TC-L-17: Username sangat panjang (200 char)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     long_user = "u" * 200
     fill_login_form(driver, long_user, VALID_PASSWORD)
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -384,13 +311,11 @@ def test_TC_L_18_login_password_very_long(driver):
     """
     TC-L-18: Password sangat panjang (500 char)
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     long_pass = "p" * 500
     fill_login_form(driver, VALID_USERNAME, long_pass)
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -399,12 +324,10 @@ def test_TC_L_19_login_non_existing_user(driver):
     """
     TC-L-19: Username tidak terdaftar
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     fill_login_form(driver, "user_tidak_ada_123", "pass123")
     submit_login(driver)
-    time.sleep(1)
 
     assert_login_fail(driver)
 
@@ -415,18 +338,15 @@ def test_TC_L_20_login_bruteforce_simple(driver):
     Expected Result ideal: sistem membatasi percobaan (rate limiting / lockout)
     Catatan: Jika tidak ada pembatasan, test ini bisa tetap PASS namun dicatat sebagai kelemahan keamanan.
     """
-    driver.get(LOGIN_URL)
-    wait_ready(driver)
+    open_page(driver, LOGIN_URL)
 
     for _ in range(5):
         fill_login_form(driver, VALID_USERNAME, "salah123")
         submit_login(driver)
-        time.sleep(0.7)
 
         # kembali ke login.php jika ada redirect
         if "login.php" not in driver.current_url.lower():
-            driver.get(LOGIN_URL)
-            wait_ready(driver)
+            open_page(driver, LOGIN_URL)
 
     # Minimal: setelah percobaan salah, tetap tidak boleh login
     assert_login_fail(driver)
@@ -0,0 +1,57 @@
+import pytest
+
+from accounts import unique_suffix
+from http_engine import submit_form
+
+
+# =========================
+# JUMLAH QUERY & INDEX PER REQUEST (QUERY_LOG=...)
+# =========================
+pytestmark = pytest.mark.usefixtures("worker_account")
+
+LOGIN_SCENARIOS = {
+    "valid": lambda account: account,
+    "wrong": lambda account: (account[0], "salah123"),
+    "unknown": lambda account: ("user_tidak_ada_123", "pass123"),
+}
+
+
+def logged_requests(query_log, page):
+    requests = query_log.requests(page)
+    assert requests, (
+        f"Request {page} tidak tercatat di {query_log.path}: server PHP/stub harus dijalankan "
+        f"dengan QUERY_LOG yang sama dengan pytest."
+    )
+    return requests
+
+
+def assert_indexed(query):
+    assert not query["full_scan"], f"Full table scan: {query['sql']}"
+    assert query["rows_examined"] <= 1, f"{query['rows_examined']} baris dibaca: {query['sql']}"
+    for row in query.get("explain") or []:
+        assert row.get("key"), f"EXPLAIN tanpa index: {row}"
+
+
+@pytest.mark.parametrize("scenario", LOGIN_SCENARIOS)
+def test_login_satu_query_dengan_index(scenario, query_log, worker_account):
+    username, password = LOGIN_SCENARIOS[scenario](worker_account)
+    # Login valid pertama boleh meng-upgrade hash (UPDATE); yang diukur request berikutnya
+    submit_form("login.php", {"username": username, "password": password})
+    submit_form("login.php", {"username": username, "password": password})
+
+    queries = logged_requests(query_log, "login.php")[-1]["queries"]
+    assert len(queries) <= 1, [q["sql"] for q in queries]
+    for query in queries:
+        assert_indexed(query)
+
+
+def test_register_satu_query(query_log):
+    username = f"ql{unique_suffix()}"
+    outcome = submit_form("register.php", {
+        "name": "Query Log", "email": f"{username}@test.com", "username": username,
+        "password": "pass123", "repassword": "pass123",
+    })
+    assert outcome.redirected
+
+    queries = [q for request in logged_requests(query_log, "register.php") for q in request["queries"]]
+    assert [q["sql"].split()[0] for q in queries] == ["INSERT"]
@@ -0,0 +1,31 @@
+import pytest
+
+import database
+from accounts import base_url
+from http_engine import ENGINE
+from tools.stress_register import check_race, delete_rows, rows_per_username, run_race
+
+
+# =========================
+# REGISTRASI SERENTAK (ENGINE=http)
+# =========================
+pytestmark = pytest.mark.skipif(ENGINE != "http", reason="Set ENGINE=http untuk menjalankan uji balapan registrasi")
+
+RACE_REQUESTS = 50
+
+
+@pytest.mark.parametrize("scenario", ["same", "distinct"])
+def test_register_race(request, scenario):
+    """
+    50 registrasi dikirim bersamaan: username sama -> tepat satu berhasil,
+    username berbeda -> semuanya berhasil. Dengan DB_RESET aktif isi tabel
+    users ikut dicek (tepat satu baris per username).
+    """
+    tag, summary = run_race(base_url(), scenario, RACE_REQUESTS)
+    rows = None
+    if database.DB_RESET != "off":
+        db = request.getfixturevalue("db")
+        rows = rows_per_username(db, tag)
+        delete_rows(db, tag)
+    print(f"{scenario}: {summary['signups_per_s']} sign-up/s, p99 {summary['latency_ms']['p99']} ms")
+    assert not check_race(scenario, RACE_REQUESTS, summary["outcomes"], rows)
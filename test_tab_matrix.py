@@ -0,0 +1,36 @@
+import pytest
+
+from cases import ALL_CASES
+from http_engine import ENGINE
+from tab_engine import TABS, run_cases
+
+
+# =========================
+# MATRIX TC-L / TC-R DI BANYAK TAB SATU BROWSER (ENGINE=tabs)
+# =========================
+pytestmark = pytest.mark.skipif(ENGINE != "tabs", reason="Set ENGINE=tabs untuk menjalankan case di tab paralel")
+
+
+@pytest.fixture(scope="session")
+def tab_results(request, driver_pool, worker_account):
+    """
+    Semua case yang terkumpul dijalankan sekaligus (TABS tab bersamaan) pada
+    test pertama; setiap test lalu melaporkan hasil case-nya. Dengan xdist,
+    grup "tabs" (--dist loadgroup, dicek di conftest) menjamin semua case
+    dijadwalkan ke worker yang sama.
+    """
+    cases = [item.callspec.params["case"] for item in request.session.items
+             if getattr(item, "originalname", "") == "test_tab_case"]
+    driver = driver_pool.acquire()
+    try:
+        return run_cases(driver, cases, TABS)
+    finally:
+        driver_pool.release(driver)
+
+
+@pytest.mark.xdist_group("tabs")
+@pytest.mark.parametrize("case", ALL_CASES, ids=lambda c: c.id)
+def test_tab_case(case, tab_results):
+    result = tab_results[case.id]
+    print(f"{case.id}: {result.seconds * 1000:.0f} ms")
+    assert not result.error, result.error
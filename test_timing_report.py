@@ -0,0 +1,56 @@
+import html
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+
+# =========================
+# KOLOM FASE DI LAPORAN PYTEST-HTML
+# =========================
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_RESET_TEST = '''
+import time
+
+import pytest
+
+import timing
+
+
+@pytest.fixture
+def slow_reset():
+    yield
+    with timing.phase("reset"):
+        time.sleep(0.01)
+
+
+def test_row(slow_reset):
+    pass
+'''
+
+
+def test_kolom_reset_terisi_dari_teardown(tmp_path):
+    """Fase reset dicatat di teardown fixture, tetapi harus muncul di baris HTML test tersebut."""
+    pytest.importorskip("pytest_html")
+    (tmp_path / "test_row.py").write_text(_RESET_TEST)
+    report = tmp_path / "report.html"
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.getenv("PYTHONPATH")])),
+        "TIMINGS_FILE": "", "TIMING_HISTORY": "", "DB_RESET": "off", "STUB_SERVER": "0",
+    }
+    proc = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", "conftest",
+         "test_row.py", f"--html={report}"],
+        cwd=tmp_path, env=env, capture_output=True, text=True,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    blob = re.search(r'data-jsonblob="([^"]*)"', report.read_text()).group(1)
+    row = json.loads(html.unescape(blob))["tests"]["test_row.py::test_row"][0]["resultsTableRow"]
+    cell = next((re.fullmatch(r'<td class="col-reset">([^<]*)</td>', c) for c in row if "col-reset" in c), None)
+    assert cell, f"Kolom reset tidak ada di baris HTML: {row}"
+    assert cell.group(1) and float(cell.group(1)) >= 10, f"Kolom reset kosong/salah: {cell.group(0)}"
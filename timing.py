@@ -0,0 +1,106 @@
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+
+# =========================
+# KONFIGURASI
+# =========================
+# Satu baris JSON per test; kosongkan (TIMINGS_FILE=) untuk menonaktifkan
+TIMINGS_FILE = os.getenv("TIMINGS_FILE", "timings.jsonl")
+
+# Urutan kolom fase di laporan HTML
+PHASES = ("driver", "get", "wait_ready", "fill", "submit", "assert", "reset", "http")
+
+
+# =========================
+# PENCATAT FASE
+# =========================
+# Timer milik test yang sedang berjalan (None di luar test -> phase() tidak mencatat apa pun)
+_current = None
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.phases = {}
+        self.navigations = []
+        self.server_timings = []
+        self.started = time.time()
+
+    def add(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def as_ms(self) -> dict:
+        return {name: round(sec * 1000, 2) for name, sec in self.phases.items()}
+
+    def server_ms(self) -> dict:
+        """Total Server-Timing per metrik dari semua request test ini."""
+        totals = {}
+        for entry in self.server_timings:
+            for name, ms in entry.items():
+                if name != "page":
+                    totals[name] = round(totals.get(name, 0.0) + ms, 2)
+        return totals
+
+
+def start() -> PhaseTimer:
+    global _current
+    _current = PhaseTimer()
+    return _current
+
+
+def stop() -> PhaseTimer:
+    global _current
+    timer, _current = _current, None
+    return timer
+
+
+@contextmanager
+def phase(name: str):
+    """Akumulasikan durasi blok ke fase `name` milik test aktif (jam monotonic, tanpa panggilan WebDriver)."""
+    timer = _current
+    if timer is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - t0)
+
+
+def record_navigation(entry: dict):
+    """Simpan satu sampel Navigation Timing (lihat browser.wait_ready) untuk test aktif."""
+    if _current is not None:
+        _current.navigations.append(entry)
+
+
+def record_server_timing(page: str, metrics: dict):
+    """Simpan metrik Server-Timing satu respons `page` (lihat nav_timing.parse_server_timing) untuk test aktif."""
+    if _current is not None and metrics:
+        _current.server_timings.append({"page": page, **metrics})
+
+
+def timed(name: str):
+    """Decorator: seluruh isi fungsi dihitung sebagai fase `name`."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def write_record(record: dict, path: str = TIMINGS_FILE):
+    """Tambahkan satu baris JSONL. Satu write O_APPEND per baris, aman untuk beberapa worker xdist."""
+    if not path:
+        return
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
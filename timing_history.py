@@ -0,0 +1,250 @@
+"""
+Riwayat timing antar run (SQLite) dan deteksi regresi latensi.
+
+    python timing_history.py record [--file timings.jsonl]   # otomatis di akhir pytest bila TIMING_HISTORY diisi
+    python timing_history.py runs
+    python timing_history.py compare --runs 10               # run terakhir vs 10 run sebelumnya
+
+Setiap run menyimpan durasi per test per fase (plus `total`) dari test yang
+lulus. `compare` membandingkan run target dengan K run sebelumnya (engine
+yang sama): untuk setiap (test, fase) dihitung median dan MAD baseline serta
+interval kepercayaan median dengan bootstrap (numpy, tervektorisasi).
+Regresi = nilai target di atas batas atas interval DAN lebih lambat dari
+median lebih dari max(--min-ms, --z x MAD terskala). Exit code 1 bila ada regresi.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import time
+
+try:
+    import numpy as np
+except ImportError:  # hanya dibutuhkan oleh perintah compare
+    np = None
+
+from timing import TIMINGS_FILE
+
+
+# =========================
+# KONFIGURASI
+# =========================
+# File SQLite riwayat timing; kosongkan (TIMING_HISTORY=) untuk menonaktifkan
+TIMING_HISTORY = os.getenv("TIMING_HISTORY", "timing_history.sqlite")
+
+# Skala MAD -> simpangan baku untuk data normal
+MAD_SCALE = 1.4826
+BOOTSTRAP_CHUNK = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded REAL NOT NULL,
+    git_rev TEXT,
+    engine TEXT,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS timings_run ON timings (run_id);
+"""
+
+
+def connect(path: str = TIMING_HISTORY):
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# =========================
+# PENCATATAN
+# =========================
+def git_rev() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def load_records(path: str = TIMINGS_FILE) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def record_run(conn, records, engine: str = "", label: str = "") -> int:
+    """Simpan satu run dari record timings.jsonl (hanya test yang lulus). Mengembalikan id run."""
+    rows = []
+    for record in records:
+        if record.get("outcome") != "passed":
+            continue
+        phases = record.get("phases_ms", {})
+        rows += [(record["test"], name, ms) for name, ms in phases.items()]
+        rows.append((record["test"], "total", round(sum(phases.values()), 2)))
+    if not rows:
+        return 0
+    engine = engine or next((r.get("engine", "") for r in records), "")
+    with conn:
+        run_id = conn.execute("INSERT INTO runs (recorded, git_rev, engine, label) VALUES (?, ?, ?, ?)",
+                              (time.time(), git_rev(), engine, label)).lastrowid
+        conn.executemany("INSERT INTO timings (run_id, test, phase, ms) VALUES (?, ?, ?, ?)",
+                         [(run_id, *row) for row in rows])
+    return run_id
+
+
+# =========================
+# STATISTIK
+# =========================
+def sample_matrix(values_by_key: dict):
+    """{key: [ms, ...]} -> (keys, matriks nilai rata kiri berisi NaN, jumlah nilai per baris)."""
+    keys = list(values_by_key)
+    counts = np.array([len(values_by_key[k]) for k in keys])
+    matrix = np.full((len(keys), counts.max(initial=1)), np.nan)
+    for i, key in enumerate(keys):
+        matrix[i, :counts[i]] = values_by_key[key]
+    return keys, matrix, counts
+
+
+def bootstrap_median_ci(matrix, counts, iterations: int = 1000, confidence: float = 0.95, seed: int = 0):
+    """Interval kepercayaan median per baris dengan resampling tervektorisasi (per potongan baris)."""
+    rng = np.random.default_rng(seed)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.empty(len(matrix)), np.empty(len(matrix))
+    width = matrix.shape[1]
+    for start in range(0, len(matrix), BOOTSTRAP_CHUNK):
+        block, n = matrix[start:start + BOOTSTRAP_CHUNK], counts[start:start + BOOTSTRAP_CHUNK]
+        # Indeks acak < n per baris; posisi >= n diabaikan agar ukuran sampel tetap n
+        idx = (rng.random((len(block), iterations, width)) * n[:, None, None]).astype(int)
+        sample = block[np.arange(len(block))[:, None, None], idx]
+        sample = np.where(np.arange(width)[None, None, :] >= n[:, None, None], np.nan, sample)
+        medians = np.nanmedian(sample, axis=2)
+        low[start:start + len(block)], high[start:start + len(block)] = np.percentile(
+            medians, [tail, 100 - tail], axis=1
+        )
+    return low, high
+
+
+def find_regressions(target: dict, baseline: dict, z: float = 4.0, min_ms: float = 5.0,
+                     iterations: int = 1000) -> list:
+    """
+    target/baseline: {(test, fase): [ms, ...]}. Mengembalikan daftar dict
+    regresi (test, phase, target_ms, median_ms, mad_ms, ci_high_ms, ratio),
+    terurut dari yang paling lambat relatif terhadap baseline.
+
+    MAD dari beberapa run saja mudah terlalu kecil, jadi dibatasi bawah oleh
+    MAD relatif gabungan semua test di fase yang sama (x median test tersebut).
+    """
+    values = {k: v for k, v in baseline.items() if k in target and len(v) >= 2}
+    if not values:
+        return []
+    keys, matrix, counts = sample_matrix(values)
+    phases = np.array([k[1] for k in keys])
+    median = np.nanmedian(matrix, axis=1)
+    mad = np.nanmedian(np.abs(matrix - median[:, None]), axis=1) * MAD_SCALE
+    relative = np.divide(mad, median, out=np.zeros_like(mad), where=median > 0)
+    pooled = np.zeros_like(mad)
+    for phase in np.unique(phases):
+        pooled[phases == phase] = np.median(relative[phases == phase])
+    noise = np.maximum(mad, pooled * median)
+    _, ci_high = bootstrap_median_ci(matrix, counts, iterations)
+    current = np.array([np.median(target[k]) for k in keys])
+
+    slower = current - median
+    regressed = (current > ci_high) & (slower > np.maximum(min_ms, z * noise))
+    ratio = np.divide(current, median, out=np.full_like(current, np.inf), where=median > 0)
+    found = [
+        {"test": keys[i][0], "phase": keys[i][1], "target_ms": round(float(current[i]), 2),
+         "median_ms": round(float(median[i]), 2), "mad_ms": round(float(noise[i]), 2),
+         "ci_high_ms": round(float(ci_high[i]), 2), "ratio": round(float(ratio[i]), 2)}
+        for i in np.flatnonzero(regressed)
+    ]
+    return sorted(found, key=lambda r: r["ratio"], reverse=True)
+
+
+# =========================
+# PEMBANDINGAN RUN
+# =========================
+def run_values(conn, run_ids) -> dict:
+    values = {}
+    marks = ",".join("?" * len(run_ids))
+    for test, phase, ms in conn.execute(f"SELECT test, phase, ms FROM timings WHERE run_id IN ({marks})", run_ids):
+        values.setdefault((test, phase), []).append(ms)
+    return values
+
+
+def compare(conn, target_run: int = None, runs: int = 10, phase: str = None, **options) -> tuple:
+    """Run target (default: terbaru) vs `runs` run sebelumnya dengan engine sama -> (target, baseline ids, regresi)."""
+    if target_run is None:
+        row = conn.execute("SELECT id, engine FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+    else:
+        row = conn.execute("SELECT id, engine FROM runs WHERE id = ?", (target_run,)).fetchone()
+    if row is None:
+        raise SystemExit("Belum ada run di riwayat timing")
+    target_id, engine = row
+    baseline_ids = [r[0] for r in conn.execute(
+        "SELECT id FROM runs WHERE id < ? AND engine = ? ORDER BY id DESC LIMIT ?", (target_id, engine, runs)
+    )]
+    target = run_values(conn, [target_id])
+    baseline = run_values(conn, baseline_ids) if baseline_ids else {}
+    if phase:
+        target = {k: v for k, v in target.items() if k[1] == phase}
+    return target_id, baseline_ids, find_regressions(target, baseline, **options)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Riwayat timing test dan deteksi regresi")
+    parser.add_argument("--db", default=TIMING_HISTORY or "timing_history.sqlite", help="file SQLite riwayat")
+    sub = parser.add_subparsers(dest="action", required=True)
+    rec = sub.add_parser("record", help="simpan timings.jsonl sebagai satu run")
+    rec.add_argument("--file", default=TIMINGS_FILE or "timings.jsonl")
+    rec.add_argument("--label", default="")
+    sub.add_parser("runs", help="daftar run tersimpan")
+    cmp_ = sub.add_parser("compare", help="bandingkan run terbaru dengan K run sebelumnya")
+    cmp_.add_argument("--run", type=int, default=None, help="id run target (default: terbaru)")
+    cmp_.add_argument("--runs", type=int, default=10, help="jumlah run baseline (K)")
+    cmp_.add_argument("--phase", default=None, help="hanya fase ini, mis. total atau submit")
+    cmp_.add_argument("--z", type=float, default=4.0, help="ambang selisih dalam satuan MAD terskala")
+    cmp_.add_argument("--min-ms", type=float, default=5.0, help="selisih minimum yang dianggap regresi")
+    cmp_.add_argument("--iterations", type=int, default=1000, help="resample bootstrap")
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    if args.action == "record":
+        run_id = record_run(conn, load_records(args.file), label=args.label)
+        print(f"Run {run_id} disimpan ke {args.db}" if run_id else "Tidak ada test lulus untuk disimpan")
+        return run_id
+    if args.action == "runs":
+        for run_id, recorded, rev, engine, label, n in conn.execute(
+            "SELECT r.id, r.recorded, r.git_rev, r.engine, r.label, COUNT(DISTINCT t.test) "
+            "FROM runs r LEFT JOIN timings t ON t.run_id = r.id GROUP BY r.id ORDER BY r.id"
+        ):
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(recorded))
+            print(f"{run_id:>5}  {when}  {rev or '-':>8}  {engine:<8} {n:>4} test  {label}")
+        return None
+
+    if np is None:
+        raise SystemExit("numpy belum terpasang (dibutuhkan compare): pip install -r requirements.txt")
+    target_id, baseline_ids, regressions = compare(
+        conn, args.run, args.runs, args.phase, z=args.z, min_ms=args.min_ms, iterations=args.iterations,
+    )
+    if not baseline_ids:
+        print(f"Run {target_id}: belum ada run sebelumnya dengan engine yang sama sebagai baseline")
+        return regressions
+    print(f"Run {target_id} vs {len(baseline_ids)} run sebelumnya ({min(baseline_ids)}-{max(baseline_ids)})")
+    if not regressions:
+        print("Tidak ada regresi")
+        return regressions
+    print(f"{'test':<60} {'fase':<10} {'target':>8} {'median':>8} {'MAD':>7} {'CI atas':>8} {'rasio':>6}")
+    for r in regressions:
+        print(f"{r['test'][-60:]:<60} {r['phase']:<10} {r['target_ms']:>8} {r['median_ms']:>8} "
+              f"{r['mad_ms']:>7} {r['ci_high_ms']:>8} {r['ratio']:>5}x")
+    raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
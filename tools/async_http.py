@@ -0,0 +1,103 @@
+"""
+Klien HTTP/1.1 asyncio minimal (stdlib saja) untuk alat uji beban.
+
+Satu `Connection` = satu koneksi keep-alive; bila server menutup koneksi
+(mis. `php -S` yang selalu mengirim `Connection: close`) koneksi dibuka
+ulang otomatis pada request berikutnya.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlencode, urlsplit
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict = field(default_factory=dict)
+    body: bytes = b""
+    elapsed: float = 0.0
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", "replace")
+
+
+def split_base_url(base_url: str):
+    parts = urlsplit(base_url)
+    if parts.scheme != "http":
+        raise ValueError(f"Hanya http:// yang didukung, bukan '{base_url}'")
+    return parts.hostname, parts.port or 80, parts.path.rstrip("/")
+
+
+class Connection:
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self.host, self.port, self.prefix = split_base_url(base_url)
+        self.timeout = timeout
+        self._reader = None
+        self._writer = None
+
+    async def post_form(self, page: str, fields: dict, headers: dict = None) -> Response:
+        body = urlencode(fields).encode()
+        head = {"Content-Type": "application/x-www-form-urlencoded", **(headers or {})}
+        return await self.request("POST", page, body, head)
+
+    async def request(self, method: str, page: str, body: bytes = b"", headers: dict = None) -> Response:
+        lines = [f"{method} {self.prefix}/{page} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                 f"Content-Length: {len(body)}"]
+        lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        raw = ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+        reused = self._writer is not None
+        try:
+            return await asyncio.wait_for(self._roundtrip(raw), self.timeout)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.close()
+            if not reused:
+                raise
+        # Koneksi keep-alive lama sudah ditutup server -> coba sekali lagi dengan koneksi baru
+        return await asyncio.wait_for(self._roundtrip(raw), self.timeout)
+
+    async def _roundtrip(self, raw: bytes) -> Response:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        start = time.perf_counter()
+        self._writer.write(raw)
+        await self._writer.drain()
+        response = await self._read_response()
+        response.elapsed = time.perf_counter() - start
+        if response.headers.get("connection", "").lower() == "close":
+            self.close()
+        return response
+
+    async def _read_response(self) -> Response:
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Server menutup koneksi")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = (await self._reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        if "content-length" in headers:
+            body = await self._reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            body = b""
+            while True:
+                size = int((await self._reader.readline()).split(b";")[0], 16)
+                chunk = await self._reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                body += chunk[:-2]
+        else:
+            body = await self._reader.read()
+            headers["connection"] = "close"
+        return Response(status, headers, body)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
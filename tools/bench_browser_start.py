@@ -0,0 +1,85 @@
+"""
+Benchmark cold start browser: waktu dari launch Chrome sampai driver.get pertama selesai.
+
+    python -m tools.bench_browser_start --make-template /tmp/chrome-template
+    python -m tools.bench_browser_start --template /tmp/chrome-template \\
+        --shell /opt/chrome-headless-shell/chrome-headless-shell --runs 5
+
+Mode yang diukur (bergantian setiap ronde):
+  chrome          -> Chrome penuh, profil baru (perilaku lama)
+  template        -> Chrome penuh, salinan CHROME_PROFILE_TEMPLATE
+  shell           -> chrome-headless-shell, profil baru
+  shell+template  -> chrome-headless-shell, salinan template
+Mode template/shell hanya diukur bila --template/--shell diisi (default dari
+CHROME_PROFILE_TEMPLATE / CHROME_HEADLESS_SHELL).
+"""
+import argparse
+import statistics
+import time
+
+from accounts import base_url
+from browser import HEADLESS, HEADLESS_SHELL, PROFILE_TEMPLATE, create_chrome_driver, make_profile_template, quit_driver
+
+
+def modes(template: str, shell: str) -> dict:
+    """Nama mode -> (profile_template, headless_shell)."""
+    result = {"chrome": ("", "")}
+    if template:
+        result["template"] = (template, "")
+    if shell:
+        result["shell"] = ("", shell)
+    if template and shell:
+        result["shell+template"] = (template, shell)
+    return result
+
+
+def measure_start(url: str, headless: bool, template: str, shell: str) -> tuple:
+    """(launch, first_get) dalam detik untuk satu browser baru."""
+    t0 = time.perf_counter()
+    driver = create_chrome_driver(headless or bool(shell), profile_template=template, headless_shell=shell)
+    t1 = time.perf_counter()
+    try:
+        driver.get(url)
+        t2 = time.perf_counter()
+    finally:
+        quit_driver(driver)
+    return t1 - t0, t2 - t1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Waktu launch Chrome sampai driver.get pertama per mode")
+    parser.add_argument("--url", default=None, help="default: BASE_URL/login.php")
+    parser.add_argument("--runs", type=int, default=5, help="ronde per mode")
+    parser.add_argument("--template", default=PROFILE_TEMPLATE, help="template user-data-dir")
+    parser.add_argument("--shell", default=HEADLESS_SHELL, help="path chrome-headless-shell")
+    parser.add_argument("--headless", action="store_true", default=HEADLESS, help="Chrome penuh juga headless")
+    parser.add_argument("--make-template", metavar="DIR", default=None,
+                        help="buat template profil di DIR lalu keluar")
+    args = parser.parse_args(argv)
+
+    if args.make_template:
+        make_profile_template(args.make_template, headless=True, headless_shell=args.shell)
+        print(f"Template profil siap: {args.make_template} (pakai dengan CHROME_PROFILE_TEMPLATE={args.make_template})")
+        return None
+
+    url = args.url or f"{base_url()}/login.php"
+    selected = modes(args.template, args.shell)
+    samples = {name: [] for name in selected}
+    for _ in range(args.runs):
+        for name, (template, shell) in selected.items():
+            samples[name].append(measure_start(url, args.headless, template, shell))
+
+    print(f"{'mode':>15} {'launch ms':>10} {'get ms':>8} {'total ms':>9} {'min ms':>8}")
+    rows = {}
+    for name, runs in samples.items():
+        launch = statistics.median(r[0] for r in runs) * 1000
+        first_get = statistics.median(r[1] for r in runs) * 1000
+        total = statistics.median(sum(r) for r in runs) * 1000
+        fastest = min(sum(r) for r in runs) * 1000
+        rows[name] = {"launch_ms": round(launch, 1), "first_get_ms": round(first_get, 1), "total_ms": round(total, 1)}
+        print(f"{name:>15} {launch:>10.1f} {first_get:>8.1f} {total:>9.1f} {fastest:>8.1f}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
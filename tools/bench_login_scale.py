@@ -0,0 +1,153 @@
+"""
+Benchmark latensi login.php terhadap jumlah user, dengan dan tanpa index username.
+
+    python -m tools.bench_login_scale --sizes 1000,100000,1000000
+
+Untuk setiap ukuran tabel, user sintetis (`bench<i>`) ditambahkan sampai
+jumlahnya tercapai, lalu login diukur dua kali: setelah index `username`
+di-drop (kondisi lama, full table scan) dan setelah index dipasang kembali.
+Dua skenario diukur terpisah:
+  hit  -> username ada (lookup + password_verify)
+  miss -> username tidak ada (murni lookup; paling terlihat saat full scan)
+Butuh PHP + MySQL yang berjalan (BASE_URL, DB_HOST, ...).
+
+login.php meng-upgrade hash yang cost-nya berbeda dari PASSWORD_COST server
+(password_hash + UPDATE pada login pertama), sehingga user benchmark harus
+di-seed dengan cost yang sama dengan server. Cost rendah membuat lookup
+lebih terlihat:
+
+    PASSWORD_COST=4 php -S 127.0.0.1:8000 &
+    PASSWORD_COST=4 python -m tools.bench_login_scale
+"""
+import argparse
+import asyncio
+import os
+import random
+
+import database
+from accounts import base_url
+from tools import seed_users
+from tools.loadtest import run_load, summarize
+
+PREFIX = "bench"
+DISTINCT_PASSWORDS = 100
+
+# Cost bcrypt server (env yang sama dengan koneksi.php)
+PASSWORD_COST = int(os.getenv("PASSWORD_COST") or 10)
+
+
+# =========================
+# PERSIAPAN DATA
+# =========================
+def seeded_count(conn) -> int:
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM users WHERE username LIKE %s", (PREFIX + "%",))
+        return cur.fetchone()[0]
+
+
+def grow_to(conn, size: int, cost: int):
+    current = seeded_count(conn)
+    if current < size:
+        seed_users.main([
+            "--count", str(size - current), "--start", str(current + 1), "--prefix", PREFIX,
+            "--distinct-passwords", str(DISTINCT_PASSWORDS), "--cost", str(cost),
+        ])
+
+
+def has_username_index(conn) -> bool:
+    with conn.cursor() as cur:
+        cur.execute("SHOW INDEX FROM users WHERE Key_name = 'username'")
+        return bool(cur.fetchall())
+
+
+def set_username_index(conn, enabled: bool):
+    if enabled == has_username_index(conn):
+        return
+    with conn.cursor() as cur:
+        if enabled:
+            cur.execute("ALTER TABLE users ADD UNIQUE KEY `username` (`username`)")
+        else:
+            cur.execute("ALTER TABLE users DROP INDEX `username`")
+
+
+def stored_hash(conn, username: str) -> str:
+    with conn.cursor() as cur:
+        cur.execute("SELECT password FROM users WHERE username = %s", (username,))
+        return cur.fetchone()[0]
+
+
+def check_server_cost(conn, url: str, cost: int):
+    """Pastikan user benchmark ber-cost `cost` dan server tidak me-rehash-nya saat login (PASSWORD_COST sama)."""
+    username, prefix = f"{PREFIX}1", f"$2y${cost:02d}$"
+    if not stored_hash(conn, username).startswith(prefix):
+        raise SystemExit("User benchmark sudah di-seed dengan cost lain; hapus dulu dengan --cleanup "
+                         "atau pakai --cost yang sama dengan seed sebelumnya.")
+    fields = {"username": username, "password": seed_users.seed_password(1, DISTINCT_PASSWORDS)}
+    asyncio.run(run_load(url, "login.php", lambda i: ("hit", fields), 1, 1))
+    stored = stored_hash(conn, username)
+    if not stored.startswith(prefix):
+        raise SystemExit(
+            f"Server me-rehash hash cost {cost} menjadi '{stored[:7]}': login pertama setiap user akan "
+            f"ikut mengukur password_hash + UPDATE. Jalankan server dengan PASSWORD_COST={cost} "
+            f"atau pakai --cost sesuai PASSWORD_COST server."
+        )
+
+
+# =========================
+# PENGUKURAN
+# =========================
+def measure(url: str, size: int, scenario: str, requests: int, concurrency: int) -> dict:
+    rng = random.Random(size)
+
+    def make_fields(i):
+        if scenario == "miss":
+            return scenario, {"username": f"{PREFIX}_tidak_ada_{i}", "password": "x"}
+        n = rng.randint(1, size)
+        return scenario, {"username": f"{PREFIX}{n}", "password": seed_users.seed_password(n, DISTINCT_PASSWORDS)}
+
+    results, elapsed = asyncio.run(run_load(url, "login.php", make_fields, concurrency, requests))
+    return summarize(results, elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latensi login.php vs jumlah user, dengan/tanpa index username")
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--requests", type=int, default=300, help="request per skenario")
+    parser.add_argument("-c", "--concurrency", type=int, default=4)
+    parser.add_argument("--cost", type=int, default=PASSWORD_COST,
+                        help="cost bcrypt user benchmark, harus sama dengan PASSWORD_COST server (default: env "
+                             "PASSWORD_COST atau 10; mis. 4 di kedua sisi agar lookup terlihat)")
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--cleanup", action="store_true", help="hapus user benchmark setelah selesai")
+    args = parser.parse_args(argv)
+
+    url = args.base_url or base_url()
+    conn = database.connect()
+    had_index = has_username_index(conn)
+    rows = []
+    try:
+        for size in sorted(int(s) for s in args.sizes.split(",")):
+            grow_to(conn, size, args.cost)
+            check_server_cost(conn, url, args.cost)
+            for indexed in (False, True):
+                set_username_index(conn, indexed)
+                for scenario in ("hit", "miss"):
+                    summary = measure(url, size, scenario, args.requests, args.concurrency)
+                    rows.append((size, "ya" if indexed else "tidak", scenario, summary))
+    finally:
+        set_username_index(conn, had_index)
+        if args.cleanup:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM users WHERE username LIKE %s", (PREFIX + "%",))
+        conn.close()
+
+    print(f"{'user':>9} {'index':>6} {'skenario':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for size, indexed, scenario, s in rows:
+        lat = s["latency_ms"]
+        print(f"{size:>9} {indexed:>6} {scenario:>8} {s['requests_per_s']:>8} "
+              f"{lat['p50']:>8} {lat['p95']:>8} {lat['p99']:>8}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+<?php
+// Benchmark biaya bcrypt per cost: waktu CPU password_hash (register) dan
+// password_verify (login) per request, serta batas login/detik per core.
+//
+//   php tools/bench_password_cost.php [cost_min] [cost_max] [detik_per_cost]
+//
+// Cost yang sedang dipakai aplikasi diambil dari PASSWORD_COST (lihat koneksi.php).
+
+$min     = (int) ($argv[1] ?? 4);
+$max     = (int) ($argv[2] ?? 14);
+$seconds = (float) ($argv[3] ?? 1.0);
+$active  = (int) (getenv('PASSWORD_COST') ?: 10);
+
+function cpu_seconds() {
+    $u = getrusage();
+    return $u['ru_utime.tv_sec'] + $u['ru_utime.tv_usec'] / 1e6
+         + $u['ru_stime.tv_sec'] + $u['ru_stime.tv_usec'] / 1e6;
+}
+
+// Rata-rata waktu CPU per panggilan $fn, minimal 3 kali atau selama $seconds
+function cpu_per_call(callable $fn, $seconds) {
+    $n     = 0;
+    $cpu0  = cpu_seconds();
+    $wall0 = microtime(true);
+    do {
+        $fn();
+        $n++;
+    } while ($n < 3 || microtime(true) - $wall0 < $seconds);
+    return (cpu_seconds() - $cpu0) / $n;
+}
+
+printf("%-6s %16s %18s %18s\n", 'cost', 'hash ms (CPU)', 'verify ms (CPU)', 'login/s per core');
+for ($cost = $min; $cost <= $max; $cost++) {
+    $options = ['cost' => $cost];
+    $hash    = password_hash('pass123', PASSWORD_DEFAULT, $options);
+
+    $hash_cpu   = cpu_per_call(function () use ($options) { password_hash('pass123', PASSWORD_DEFAULT, $options); }, $seconds / 2);
+    $verify_cpu = cpu_per_call(function () use ($hash) { password_verify('pass123', $hash); }, $seconds);
+
+    printf("%-6s %16.2f %18.2f %18.1f\n",
+        $cost . ($cost == $active ? '*' : ''),
+        $hash_cpu * 1000,
+        $verify_cpu * 1000,
+        $verify_cpu > 0 ? 1 / $verify_cpu : 0
+    );
+}
+echo "* = cost aktif (PASSWORD_COST)\n";
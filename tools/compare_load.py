@@ -0,0 +1,54 @@
+"""
+Bandingkan throughput login.php di dua server (sebelum vs sesudah perubahan).
+
+    python -m tools.compare_load --before http://127.0.0.1:8001 --after http://127.0.0.1:8000
+
+Kedua server diberi beban yang sama (campuran skenario tools/loadtest.py)
+secara bergantian selama beberapa ronde, sehingga gangguan sesaat di mesin
+terbagi rata ke keduanya. Hasil per server diambil dari ronde dengan
+request/detik median.
+"""
+import argparse
+import asyncio
+
+from tools.loadtest import SCENARIOS, parse_mix, run_load, summarize
+
+
+def measure(url: str, mix: list, concurrency: int, requests: int) -> dict:
+    results, elapsed = asyncio.run(run_load(
+        url, "login.php", lambda i: (mix[i % len(mix)], SCENARIOS[mix[i % len(mix)]]), concurrency, requests,
+    ))
+    return summarize(results, elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan req/s login.php di dua server")
+    parser.add_argument("--before", required=True, help="base URL server sebelum perubahan")
+    parser.add_argument("--after", required=True, help="base URL server sesudah perubahan")
+    parser.add_argument("-c", "--concurrency", type=int, default=20)
+    parser.add_argument("-n", "--requests", type=int, default=1000, help="request per ronde per server")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("valid=1,wrong=1,unknown=1"),
+                        help="bobot skenario (pilihan: %s)" % ", ".join(SCENARIOS))
+    args = parser.parse_args(argv)
+
+    servers = {"sebelum": args.before, "sesudah": args.after}
+    rounds = {name: [] for name in servers}
+    for _ in range(args.rounds):
+        for name, url in servers.items():
+            rounds[name].append(measure(url, args.mix, args.concurrency, args.requests))
+
+    median = {name: sorted(runs, key=lambda s: s["requests_per_s"])[len(runs) // 2] for name, runs in rounds.items()}
+    print(f"{'server':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  hasil")
+    for name, s in median.items():
+        lat = s["latency_ms"]
+        outcomes = ", ".join(f"{k}={v}" for k, v in sorted(s["outcomes"].items()))
+        print(f"{name:>8} {s['requests_per_s']:>8} {lat['p50']:>8} {lat['p95']:>8} {lat['p99']:>8}  {outcomes}")
+    before, after = median["sebelum"]["requests_per_s"], median["sesudah"]["requests_per_s"]
+    if before:
+        print(f"rasio req/s sesudah/sebelum: {after / before:.2f}x")
+    return median
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Uji beban login.php: login valid & tidak valid secara paralel dengan asyncio.
+
+    python -m tools.loadtest --concurrency 20 --requests 2000
+    python -m tools.loadtest --rate 200 --duration 30 --mix valid=1,wrong=3
+
+Bisa dipakai terhadap `php -S 127.0.0.1:8000` (set PHP_CLI_SERVER_WORKERS=N
+agar server built-in PHP melayani lebih dari satu request sekaligus) maupun
+stub_server.py. Alamat diambil dari BASE_URL bila --base-url tidak diisi.
+Bila server mengirim header Server-Timing (SERVER_TIMING=1), ringkasan ikut
+menampilkan p50/p95 setiap metrik server (connect, query, hash, verify).
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import Counter
+
+from accounts import VALID_PASSWORD, VALID_USERNAME, base_url
+from nav_timing import parse_server_timing
+from tools.async_http import Connection
+
+
+# =========================
+# SKENARIO
+# =========================
+SCENARIOS = {
+    "valid": {"username": VALID_USERNAME, "password": VALID_PASSWORD},
+    "wrong": {"username": VALID_USERNAME, "password": "salah123"},
+    "unknown": {"username": "user_tidak_ada_123", "password": "pass123"},
+    "empty": {"username": "", "password": ""},
+}
+
+
+def classify(response) -> str:
+    """Kelompokkan respons login.php / register.php berdasarkan hasilnya."""
+    if 300 <= response.status < 400:
+        return "redirect"
+    if response.status != 200:
+        return f"http_{response.status}"
+    body = response.text()
+    if "Register User Gagal" in body:
+        return "register_user_gagal"
+    if "Data tidak boleh kosong" in body:
+        return "data_tidak_boleh_kosong"
+    if "Username sudah terdaftar" in body:
+        return "username_sudah_terdaftar"
+    if "Password tidak sama" in body:
+        return "password_tidak_sama"
+    return "form_tanpa_pesan"
+
+
+def percentile(sorted_values, pct: float) -> float:
+    """Persentil nearest-rank dari data yang sudah terurut."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def parse_mix(text: str) -> list:
+    weighted = []
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Skenario tidak dikenal: {name} (pilihan: {', '.join(SCENARIOS)})")
+        try:
+            count = int(weight or 1)
+        except ValueError:
+            count = 0
+        if count < 1:
+            raise argparse.ArgumentTypeError(f"Bobot skenario harus bilangan bulat >= 1: '{part}'")
+        weighted += [name] * count
+    return weighted
+
+
+# =========================
+# GENERATOR BEBAN
+# =========================
+async def run_load(url, page, make_fields, concurrency, requests=None, duration=None, rate=None, timeout=10.0):
+    """
+    Jalankan `concurrency` klien paralel sampai `requests` request terkirim
+    atau `duration` detik berlalu. `make_fields(i)` -> (label, fields) untuk
+    request ke-i. Dengan `rate` (request/detik) request ke-i dijadwalkan pada
+    start + i/rate dan latensinya dihitung dari jadwal tersebut, sehingga
+    antrean akibat server lambat ikut terukur (tanpa coordinated omission).
+    """
+    results = []
+    next_index = 0
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    async def client():
+        nonlocal next_index
+        conn = Connection(url, timeout)
+        try:
+            while True:
+                i = next_index
+                if requests is not None and i >= requests:
+                    return
+                next_index += 1
+                scheduled = start + i / rate if rate else None
+                if scheduled is not None:
+                    await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                now = time.perf_counter()
+                if deadline is not None and now >= deadline:
+                    return
+                label, fields = make_fields(i)
+                try:
+                    response = await conn.post_form(page, {**fields, "submit": ""})
+                    outcome = classify(response)
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as err:
+                    conn.close()
+                    response, outcome = None, f"error_{type(err).__name__}"
+                latency = time.perf_counter() - (scheduled or now)
+                results.append((label, outcome, latency, response))
+        finally:
+            conn.close()
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return results, time.perf_counter() - start
+
+
+def summarize(results, elapsed) -> dict:
+    latencies = sorted(r[2] for r in results)
+    per_label = {}
+    server = {}
+    for label, outcome, _, response in results:
+        per_label.setdefault(label, Counter())[outcome] += 1
+        if response is not None:
+            for name, ms in parse_server_timing(response.headers.get("server-timing", "")).items():
+                server.setdefault(name, []).append(ms)
+    return {
+        "requests": len(results),
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(results) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            f"p{p}": round(percentile(latencies, p) * 1000, 2) for p in (50, 95, 99)
+        } | {"max": round(latencies[-1] * 1000, 2) if latencies else 0.0},
+        "outcomes": dict(Counter(r[1] for r in results)),
+        "outcomes_per_scenario": {k: dict(v) for k, v in per_label.items()},
+        "server_timing_ms": {
+            name: {f"p{p}": round(percentile(sorted(values), p), 2) for p in (50, 95)}
+            for name, values in server.items()
+        },
+    }
+
+
+def print_summary(title: str, summary: dict):
+    lat = summary["latency_ms"]
+    print(f"== {title} ==")
+    print(f"request      : {summary['requests']} dalam {summary['elapsed_s']} s "
+          f"({summary['requests_per_s']} req/s)")
+    print(f"latensi (ms) : p50={lat['p50']}  p95={lat['p95']}  p99={lat['p99']}  max={lat['max']}")
+    if summary["server_timing_ms"]:
+        detail = "  ".join(f"{name} p50={v['p50']} p95={v['p95']}" for name, v in summary["server_timing_ms"].items())
+        print(f"server (ms)  : {detail}")
+    for label, outcomes in summary["outcomes_per_scenario"].items():
+        detail = ", ".join(f"{k}={v}" for k, v in sorted(outcomes.items()))
+        print(f"  {label:<10} {detail}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji beban login.php (asyncio)")
+    parser.add_argument("--base-url", default=None, help="default: BASE_URL")
+    parser.add_argument("-c", "--concurrency", type=int, default=10)
+    parser.add_argument("-n", "--requests", type=int, default=None, help="jumlah total request")
+    parser.add_argument("-d", "--duration", type=float, default=None, help="lama uji (detik)")
+    parser.add_argument("--rate", type=float, default=None, help="target request/detik (open-loop)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("valid=1,wrong=1,unknown=1,empty=1"),
+                        help="bobot skenario, mis. valid=1,wrong=3 (pilihan: %s)" % ", ".join(SCENARIOS))
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--json", dest="json_path", default=None, help="simpan ringkasan ke file JSON")
+    args = parser.parse_args(argv)
+    if args.requests is None and args.duration is None:
+        args.requests = 1000
+
+    mix = args.mix
+    results, elapsed = asyncio.run(run_load(
+        args.base_url or base_url(), "login.php",
+        lambda i: (mix[i % len(mix)], SCENARIOS[mix[i % len(mix)]]),
+        args.concurrency, args.requests, args.duration, args.rate, args.timeout,
+    ))
+    summary = summarize(results, elapsed)
+    print_summary("login.php", summary)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Seeder user sintetis dalam jumlah besar untuk tabel users.
+
+    python -m tools.seed_users --count 1000000
+    python -m tools.seed_users --count 100000 --output seed.sql   # tulis SQL, import dengan mysql
+
+User ke-i: username `<prefix><i>`, email `<prefix><i>@seed.test`, password
+`seedpass<i mod distinct>`. Hash bcrypt dihitung sekali per password berbeda
+(--distinct-passwords) secara paralel di process pool, lalu dipakai ulang,
+sehingga biaya bcrypt tidak tumbuh dengan jumlah user. Baris dimasukkan
+dengan INSERT multi-baris per batch.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import bcrypt
+except ImportError:
+    bcrypt = None
+
+import database
+
+
+# =========================
+# DATA USER
+# =========================
+def seed_password(i: int, distinct: int) -> str:
+    return f"seedpass{i % distinct}"
+
+
+def php_bcrypt(password: str, cost: int) -> str:
+    """Hash bcrypt dengan prefix $2y$ seperti password_hash() PHP."""
+    hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=cost)).decode()
+    return "$2y$" + hashed[4:]
+
+
+def hash_passwords(passwords, cost: int, workers: int) -> dict:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        hashes = pool.map(php_bcrypt, passwords, [cost] * len(passwords), chunksize=max(1, len(passwords) // (workers * 4)))
+        return dict(zip(passwords, hashes))
+
+
+def user_rows(start: int, count: int, prefix: str, distinct: int, hashes: dict):
+    for i in range(start, start + count):
+        yield (f"Seed User {i}", f"{prefix}{i}", f"{prefix}{i}@seed.test", hashes[seed_password(i, distinct)])
+
+
+def batches(rows, size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# =========================
+# PENULISAN
+# =========================
+INSERT_SQL = "INSERT INTO users (name, username, email, password) VALUES (%s, %s, %s, %s)"
+
+
+def insert_into_db(rows, batch_size: int) -> int:
+    conn = database.connect()
+    conn.autocommit(False)
+    total = 0
+    try:
+        with conn.cursor() as cur:
+            for batch in batches(rows, batch_size):
+                # PyMySQL menggabungkan executemany INSERT ... VALUES menjadi INSERT multi-baris
+                cur.executemany(INSERT_SQL, batch)
+                conn.commit()
+                total += len(batch)
+    finally:
+        conn.close()
+    return total
+
+
+def write_sql(rows, batch_size: int, path: str) -> int:
+    def quote(value: str) -> str:
+        return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+    total = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for batch in batches(rows, batch_size):
+            values = ",\n".join("(" + ", ".join(quote(v) for v in row) + ")" for row in batch)
+            f.write(f"INSERT INTO `users` (`name`, `username`, `email`, `password`) VALUES\n{values};\n")
+            total += len(batch)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seeder user sintetis untuk tabel users")
+    parser.add_argument("-n", "--count", type=int, default=1000)
+    parser.add_argument("--start", type=int, default=1, help="nomor user pertama (untuk menambah seed tanpa bentrok)")
+    parser.add_argument("--prefix", default="seed")
+    parser.add_argument("--distinct-passwords", type=int, default=100, help="jumlah password berbeda (hash di-cache)")
+    parser.add_argument("--cost", type=int, default=10, help="cost bcrypt (PASSWORD_DEFAULT PHP = 10)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="proses paralel untuk bcrypt")
+    parser.add_argument("--batch", type=int, default=5000, help="baris per INSERT")
+    parser.add_argument("--output", default=None, help="tulis file SQL alih-alih insert langsung ke database")
+    args = parser.parse_args(argv)
+    if bcrypt is None:
+        raise SystemExit("Paket bcrypt belum terpasang: pip install -r requirements.txt")
+
+    distinct = min(args.distinct_passwords, args.count)
+    passwords = sorted({seed_password(i, distinct) for i in range(args.start, args.start + distinct)})
+    t0 = time.perf_counter()
+    hashes = hash_passwords(passwords, args.cost, args.workers)
+    t1 = time.perf_counter()
+    print(f"bcrypt  : {len(hashes)} hash (cost {args.cost}, {args.workers} proses) dalam {t1 - t0:.2f} s")
+
+    rows = user_rows(args.start, args.count, args.prefix, distinct, hashes)
+    if args.output:
+        total = write_sql(rows, args.batch, args.output)
+        target = args.output
+    else:
+        total = insert_into_db(rows, args.batch)
+        target = f"{database.DB_NAME}.users"
+    t2 = time.perf_counter()
+    print(f"insert  : {total} user ke {target} dalam {t2 - t1:.2f} s ({total / max(t2 - t1, 1e-9):.0f} baris/s)")
+    return total
+
+
+if __name__ == "__main__":
+    main()
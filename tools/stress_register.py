@@ -0,0 +1,137 @@
+"""
+Uji balapan registrasi: ratusan register.php serentak untuk username yang sama dan berbeda.
+
+    python -m tools.stress_register --requests 300
+    python -m tools.stress_register --requests 300 --no-db   # tanpa cek tabel users (mis. stub_server.py)
+
+Skenario:
+  same     -> semua request mendaftarkan SATU username (email berbeda);
+              tepat satu boleh berhasil, sisanya "Username sudah terdaftar"
+  distinct -> setiap request memakai username sendiri; semua harus berhasil
+Setiap request memakai koneksi sendiri dan dikirim bersamaan. Setelah beban
+selesai hasil HTTP dan isi tabel users dicek (tepat satu baris per username),
+lalu dilaporkan sign-up/detik dan latensi p50/p95/p99/max.
+"""
+import argparse
+import asyncio
+from collections import Counter
+
+import database
+from accounts import base_url, unique_suffix
+from tools.loadtest import run_load, summarize
+
+PREFIX = "race"
+PASSWORD = "pass123"
+SCENARIOS = ("same", "distinct")
+
+
+# =========================
+# DATA REGISTRASI
+# =========================
+def register_fields(scenario: str, tag: str):
+    """make_fields(i) untuk run_load: username sama (same) atau berbeda (distinct), email selalu berbeda."""
+    def make_fields(i):
+        username = f"{PREFIX}{tag}" if scenario == "same" else f"{PREFIX}{tag}n{i}"
+        return scenario, {
+            "name": "Race User",
+            "email": f"{PREFIX}{tag}n{i}@race.test",
+            "username": username,
+            "password": PASSWORD,
+            "repassword": PASSWORD,
+        }
+    return make_fields
+
+
+def expected_outcomes(scenario: str, requests: int) -> dict:
+    if scenario == "same":
+        return {"redirect": 1, "username_sudah_terdaftar": requests - 1} if requests > 1 else {"redirect": 1}
+    return {"redirect": requests}
+
+
+# =========================
+# VERIFIKASI
+# =========================
+def rows_per_username(conn, tag: str) -> dict:
+    with conn.cursor() as cur:
+        cur.execute("SELECT username, COUNT(*) FROM users WHERE username LIKE %s GROUP BY username",
+                    (f"{PREFIX}{tag}%",))
+        return dict(cur.fetchall())
+
+
+def delete_rows(conn, tag: str):
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM users WHERE username LIKE %s", (f"{PREFIX}{tag}%",))
+
+
+def check_race(scenario: str, requests: int, outcomes: dict, rows: dict = None) -> list:
+    """Daftar masalah (kosong = lolos): hasil HTTP tidak sesuai, atau username dengan jumlah baris != 1."""
+    problems = []
+    expected = expected_outcomes(scenario, requests)
+    if outcomes != expected:
+        problems.append(f"{scenario}: hasil HTTP {outcomes}, seharusnya {expected}")
+    if rows is not None:
+        duplicates = {u: n for u, n in rows.items() if n != 1}
+        if duplicates:
+            problems.append(f"{scenario}: username dengan lebih dari satu baris: {duplicates}")
+        usernames = 1 if scenario == "same" else requests
+        if len(rows) != usernames:
+            problems.append(f"{scenario}: {len(rows)} username di tabel users, seharusnya {usernames}")
+    return problems
+
+
+# =========================
+# EKSEKUSI
+# =========================
+def run_race(url: str, scenario: str, requests: int, concurrency: int = None, timeout: float = 30.0):
+    """Kirim `requests` registrasi serentak -> (tag, summary). Default satu koneksi per request."""
+    tag = unique_suffix(6)
+    results, elapsed = asyncio.run(run_load(
+        url, "register.php", register_fields(scenario, tag), concurrency or requests, requests, timeout=timeout,
+    ))
+    summary = summarize(results, elapsed)
+    signups = summary["outcomes"].get("redirect", 0)
+    summary["signups_per_s"] = round(signups / elapsed, 1) if elapsed else 0.0
+    return tag, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji balapan registrasi serentak di register.php")
+    parser.add_argument("--base-url", default=None, help="default: BASE_URL")
+    parser.add_argument("-n", "--requests", type=int, default=300, help="registrasi per skenario")
+    parser.add_argument("-c", "--concurrency", type=int, default=None, help="default: sama dengan --requests")
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="default: keduanya")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--no-db", action="store_true", help="lewati pengecekan tabel users")
+    parser.add_argument("--keep", action="store_true", help="jangan hapus user hasil uji")
+    args = parser.parse_args(argv)
+
+    url = args.base_url or base_url()
+    conn = None if args.no_db else database.connect()
+    problems = []
+    try:
+        for scenario in args.scenario or SCENARIOS:
+            tag, summary = run_race(url, scenario, args.requests, args.concurrency, args.timeout)
+            rows = rows_per_username(conn, tag) if conn else None
+            problems += check_race(scenario, args.requests, summary["outcomes"], rows)
+            if conn and not args.keep:
+                delete_rows(conn, tag)
+
+            lat = summary["latency_ms"]
+            print(f"== {scenario} ({args.requests} registrasi serentak) ==")
+            print(f"sign-up/s    : {summary['signups_per_s']} ({summary['requests_per_s']} req/s)")
+            print(f"latensi (ms) : p50={lat['p50']}  p95={lat['p95']}  p99={lat['p99']}  max={lat['max']}")
+            print(f"hasil        : {', '.join(f'{k}={v}' for k, v in sorted(Counter(summary['outcomes']).items()))}")
+            if rows is not None:
+                print(f"tabel users  : {len(rows)} username, {sum(rows.values())} baris")
+    finally:
+        if conn:
+            conn.close()
+
+    for problem in problems:
+        print(f"GAGAL: {problem}")
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()